@@ -62,6 +62,7 @@ for i, category in enumerate(categories):
                 try:
                     # Clear cache
                     data_loader.load_category_data.clear()
+                    data_loader.load_category_meta.clear()
                     
                     # Force refresh
                     data_loader.refresh_category_cache(category)
@@ -83,6 +84,7 @@ st.header("✔️ Data Validation")
 if st.button("🔍 Validate All Data"):
     with st.spinner("Validating data..."):
         issues = []
+        data_loader.preload_categories(categories)
         
         for category in categories:
             try:
@@ -122,32 +124,20 @@ st.header("📈 Data Statistics")
 
 if st.button("📊 Show Statistics"):
     stats_data = []
+    data_loader.preload_categories(categories)
     
     for category in categories:
         try:
             items = data_loader.load_category_data(category)
-            
-            # Count services
-            all_services = set()
-            all_languages = set()
-            all_zips = set()
-            with_badges = 0
-            
-            for item in items:
-                all_services.update(item.get("services", []))
-                all_languages.update(item.get("languages", []))
-                if item.get("zip_code"):
-                    all_zips.add(item["zip_code"])
-                if item.get("availability_badges"):
-                    with_badges += 1
+            meta = data_loader.load_category_meta(category)
             
             stats_data.append({
                 "Category": category,
                 "Total Items": len(items),
-                "Unique Services": len(all_services),
-                "Unique Languages": len(all_languages),
-                "Unique ZIPs": len(all_zips),
-                "With Badges": with_badges
+                "Unique Services": len(meta["services"]),
+                "Unique Languages": len(meta["langs"]),
+                "Unique ZIPs": len(meta["zips"]),
+                "With Badges": sum(1 for item in items if item.get("availability_badges"))
             })
         except Exception as e:
             stats_data.append({
@@ -167,6 +157,7 @@ st.header("🗑️ Cache Management")
 if st.button("🗑️ Clear All Caches"):
     try:
         data_loader.load_category_data.clear()
+        data_loader.load_category_meta.clear()
         st.success("✅ All caches cleared!")
     except Exception as e:
         st.error(f"❌ Error clearing cache: {e}")
@@ -8,6 +8,9 @@ st.title("💬 Chat with Local LLM")
 # Use session state to store messages
 if "chat_history" not in st.session_state:
     st.session_state.chat_history = []
+# Same conversation in the shape ollama.chat expects, appended in place
+if "api_messages" not in st.session_state:
+    st.session_state.api_messages = []
 
 # User input
 prompt = st.chat_input("Type your question here...")
@@ -21,18 +24,20 @@ for role, msg in st.session_state.chat_history:
 if prompt:
     # Show user message
     st.session_state.chat_history.append(("user", prompt))
+    st.session_state.api_messages.append({"role": "user", "content": prompt})
     with st.chat_message("user"):
         st.markdown(prompt)
 
     # Send to Ollama
     response = ollama.chat(
         model="llama3",
-        messages=[{"role": role, "content": msg} for role, msg in st.session_state.chat_history]
+        messages=st.session_state.api_messages
     )
 
     reply = response['message']['content']
 
     # Show assistant message
     st.session_state.chat_history.append(("assistant", reply))
+    st.session_state.api_messages.append({"role": "assistant", "content": reply})
     with st.chat_message("assistant"):
         st.markdown(reply)
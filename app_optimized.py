@@ -5,6 +5,7 @@ Using modular components for better performance and maintainability.
 """
 
 import streamlit as st
+import sys
 import uuid
 import database as db
 from typing import List, Dict, Tuple
@@ -30,16 +31,34 @@ ui_components.render_mobile_friendly_category_selector()
 # ===========================
 TOP_N = 10  # Show more results initially
 MORE_N = 10  # Show this many more when "Show More" is clicked
+# Interned: used as session_state and per-category dict keys on every rerun
+CATEGORIES = tuple(sys.intern(c) for c in ("Healthcare", "Education", "Resettlement / Legal / Shelter"))
+
+# ===========================
+# Data Loading
+# ===========================
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_dataset(category: str) -> Tuple[List[Dict], Dict, str]:
+    """Load (items, meta, version) for a category, shared across sessions and reruns.
+    version is new on every load, so load_item_columns can tell reloads apart."""
+    items, meta = data_loader.get_dataset(category)
+    return items, meta, uuid.uuid4().hex
+
+@st.cache_resource(max_entries=2 * len(CATEGORIES), show_spinner=False)
+def load_item_columns(category: str, version: str, _items: List[Dict]) -> search.ItemColumns:
+    """Search columns for one load of a category's items. They are read-only, so they are
+    kept as a resource instead of being pickled and unpickled on every rerun."""
+    return search.build_item_columns(_items)
 
 # ===========================
 # Session State
 # ===========================
-st.session_state.setdefault("category", "Healthcare")
-st.session_state.setdefault("datasets_cache", {})
+st.session_state.setdefault("category", CATEGORIES[0])
 st.session_state.setdefault("messages", [])
 st.session_state.setdefault("pinned", [])
 st.session_state.setdefault("last_query_by_cat", {})
 st.session_state.setdefault("shown_ids_by_cat", {})
+st.session_state.setdefault("ranked_by_cat", {})
 st.session_state.setdefault("scroll_flag", False)
 st.session_state.setdefault("misspelling_suggestion", None)
 st.session_state.setdefault("waiting_for_misspelling_response", False)
@@ -59,49 +78,56 @@ with st.sidebar:
     st.subheader("📂 Category")
     category = st.radio(
         "Choose a category:",
-        ["Healthcare", "Education", "Resettlement / Legal / Shelter"],
+        CATEGORIES,
         key="category_selector"
     )
     
     if category != st.session_state["category"]:
         st.session_state["category"] = category
-        st.session_state["shown_ids_by_cat"][category] = []
+        st.session_state["shown_ids_by_cat"][category] = set()
+        # The cached ranking's cursor counts what was shown, so it goes with shown_ids
+        st.session_state["ranked_by_cat"].pop(category, None)
         st.session_state["show_more"] = False
-        st.rerun()
     
     # Load data for current category
-    items, raw_text = data_loader.get_dataset(category)
+    items, meta, data_version = load_dataset(category)
+    item_columns = load_item_columns(category, data_version, items)
     
     # Enhanced filters
-    zip_filter, lang_filter, service_filter, day_filter = ui_components.render_enhanced_filters(category, items)
+    zip_filter, lang_filter, service_filter, day_filter = ui_components.render_enhanced_filters(category, items, meta)
     
-    # Reset and refresh controls
+    # Reset, refresh and scroll controls, submitted together as one rerun
     st.subheader("🔄 Actions")
-    col1, col2 = st.columns(2)
+    with st.form("actions", border=False):
+        col1, col2 = st.columns(2)
+        reset_clicked = col1.form_submit_button("🔄 Reset Chat")
+        refresh_clicked = col2.form_submit_button("🔄 Refresh Data")
+        scroll_clicked = st.form_submit_button("⏬ Scroll to Latest")
     
-    with col1:
-        if st.button("🔄 Reset Chat"):
-            st.session_state["messages"] = []
-            st.session_state["pinned"] = []
-            st.session_state["last_query_by_cat"] = {}
-            st.session_state["shown_ids_by_cat"] = {}
-            st.session_state["scroll_flag"] = False
-            st.session_state["misspelling_suggestion"] = None
-            st.session_state["waiting_for_misspelling_response"] = False
-            st.session_state["datasets_cache"] = {}
-            st.session_state["convo_id"] = uuid.uuid4().hex[:12]
-            st.rerun()
+    # The sidebar runs before the chat history, so state changed here is
+    # picked up later in this same run without another st.rerun()
+    if reset_clicked:
+        st.session_state["messages"] = []
+        st.session_state["pinned"] = []
+        st.session_state["last_query_by_cat"] = {}
+        st.session_state["shown_ids_by_cat"] = {}
+        st.session_state["ranked_by_cat"] = {}
+        st.session_state["scroll_flag"] = False
+        st.session_state["misspelling_suggestion"] = None
+        st.session_state["waiting_for_misspelling_response"] = False
+        st.session_state["convo_id"] = uuid.uuid4().hex[:12]
     
-    with col2:
-        if st.button("🔄 Refresh Data"):
-            data_loader.refresh_category_cache(category)
-            st.success("Data refreshed!")
-            st.rerun()
+    if refresh_clicked:
+        # Filters above were built from the old data, so this one still reruns
+        data_loader.refresh_category_cache(category)
+        load_dataset.clear()
+        load_item_columns.clear()
+        # Cached rankings hold items from before the refresh
+        st.session_state["ranked_by_cat"] = {}
+        st.rerun()
     
-    # Scroll control
-    if st.button("⏬ Scroll to Latest"):
+    if scroll_clicked:
         st.session_state["scroll_flag"] = True
-        st.rerun()
     
     # Pinned resources
     ui_components.render_pinned_sidebar()
@@ -121,17 +147,22 @@ with st.sidebar:
 # ===========================
 
 # Display chat history
-for message in st.session_state["messages"]:
-    with st.chat_message(message["role"]):
-        if message["role"] == "user":
-            st.markdown(message["text"])
-        else:
-            if "render" in message:
-                # Render cards
-                for i, result in enumerate(message["results"], 1):
-                    ui_components.render_enhanced_card(i, result, message["category"])
-            else:
+@st.fragment
+def render_history():
+    """Render past messages; widget clicks inside the cards rerun only this fragment."""
+    for message in st.session_state["messages"]:
+        with st.chat_message(message["role"]):
+            if message["role"] == "user":
                 st.markdown(message["text"])
+            else:
+                if "render" in message:
+                    # Render cards
+                    for i, result in enumerate(message["results"], 1):
+                        ui_components.render_enhanced_card(i, result, message["category"])
+                else:
+                    st.markdown(message["text"])
+
+render_history()
 
 # ===========================
 # Chat Input and Response
@@ -151,6 +182,11 @@ def respond_to_query(user_text: str, category: str):
         query = user_text
         st.session_state["last_query_by_cat"][category] = query
     
+    # "more" pages through the previous ranking as long as the search hasn't changed
+    search_key = (query, zip_filter, lang_filter, service_filter, day_filter)
+    cached = st.session_state["ranked_by_cat"].get(category)
+    reuse_ranking = is_more and cached is not None and cached["key"] == search_key
+    
     # Auto-detect filters from query
     detected_zip = None
     detected_service = None
@@ -167,35 +203,48 @@ def respond_to_query(user_text: str, category: str):
         st.session_state[f"detected_day_{category}"] = detected_day
         
         # Clean query
-        query = search.clean_query_of_zip(query)
-        query = search.clean_query_of_service_and_day(query, detected_service, detected_day)
+        query = search.clean_query_of_detected(query, detected_service, detected_day)
     
-    # Use detected filters or sidebar filters
-    zf = detected_zip or zip_filter or "All"
-    lf = lang_filter or "All"
-    sf = detected_service or service_filter or "All"
-    df = detected_day or day_filter or "All"
-    
-    # Enhanced search with fuzzy matching
-    ranked = search.rank_items(items, query, category, zf, lf, sf, df)
+    if reuse_ranking:
+        ranked = cached["ranked"]
+    else:
+        # Use detected filters or sidebar filters, normalized once for the whole search
+        ctx = search.build_search_context(
+            query,
+            zip_filter=detected_zip or zip_filter,
+            lang_filter=lang_filter,
+            service_filter=detected_service or service_filter,
+            day_filter=detected_day or day_filter,
+        )
+        
+        # Enhanced search with fuzzy matching
+        ranked = search.rank_items_ctx(items, ctx, category, item_columns)
+        cached = {"key": search_key, "ranked": ranked, "cursor": 0}
+        st.session_state["ranked_by_cat"][category] = cached
     
     # Handle pagination
-    shown_map = st.session_state["shown_ids_by_cat"]
-    prev_ids = set(shown_map.get(category, []))
+    shown_ids = st.session_state["shown_ids_by_cat"].setdefault(category, set())
     
     if is_more or st.session_state.get("show_more", False):
         # Show more results
-        fresh = [c for _, c in ranked if c["id"] not in prev_ids]
-        to_show = fresh[:MORE_N]
+        page_size = MORE_N
         st.session_state["show_more"] = False
     else:
         # Show initial results
-        fresh = [c for _, c in ranked if c["id"] not in prev_ids]
-        to_show = fresh[:TOP_N]
+        page_size = TOP_N
+    
+    # Continue from where the last page stopped, skipping anything already shown
+    to_show = []
+    cursor = cached["cursor"]
+    while cursor < len(ranked) and len(to_show) < page_size:
+        item = ranked[cursor][1]
+        cursor += 1
+        if item["id"] not in shown_ids:
+            to_show.append(item)
+    cached["cursor"] = cursor
     
     # Update shown IDs
-    ids = [c["id"] for c in to_show]
-    shown_map[category] = list(prev_ids | set(ids))
+    shown_ids.update(c["id"] for c in to_show)
     
     # Display results
     with st.chat_message("assistant"):
@@ -231,7 +280,7 @@ def respond_to_query(user_text: str, category: str):
             
             # Pagination controls
             total_ranked = len(ranked)
-            shown_count = len(shown_map.get(category, []))
+            shown_count = len(shown_ids)
             
             if ui_components.render_pagination_controls(total_ranked, shown_count):
                 st.session_state["show_more"] = True
@@ -252,7 +301,7 @@ def respond_to_query(user_text: str, category: str):
             
             reply_text = summarize_results(to_show)
             reply_json = {"category": category, "results": to_show, "query": query}
-            db.save_assistant_message(
+            db.queue_assistant_message(
                 convo_id=st.session_state["convo_id"],
                 reply_text=reply_text,
                 reply_json=reply_json,
@@ -281,7 +330,7 @@ def respond_to_query(user_text: str, category: str):
             # Log no results
             reply_text = "No matches found for query"
             reply_json = {"category": category, "results": [], "query": query}
-            db.save_assistant_message(
+            db.queue_assistant_message(
                 convo_id=st.session_state["convo_id"],
                 reply_text=reply_text,
                 reply_json=reply_json,
@@ -309,7 +358,7 @@ if prompt:
     st.session_state["messages"].append({"role": "user", "text": prompt})
     
     # Log user message to database
-    db.save_user_message(
+    db.queue_user_message(
         convo_id=st.session_state["convo_id"],
         query_text=prompt,
         category=category,
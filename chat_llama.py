@@ -1,9 +1,17 @@
 import streamlit as st
-import requests
+import os
+import sys
 import re
 import uuid
+import urllib.parse
+import html
+from types import MappingProxyType
+import io
+import numpy as np
 import database as db
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Mapping, Tuple, Iterable, Iterator
 import search_helpers
 import data_loader
 import neighborhood_mapping
@@ -39,6 +47,13 @@ div[role="radiogroup"] label[data-checked="true"]{
   padding: 0.25rem 0.5rem;
   font-size: 0.85rem;
 }
+
+/* Directions / call / website links in result cards, styled like st.link_button */
+a.card-link {
+  display:block; text-align:center; text-decoration:none;
+  border:1px solid rgba(49,51,63,0.2); border-radius:0.5rem;
+  padding:0.35rem 0.75rem; margin:0.25rem 0 0.75rem 0;
+}
 </style>
 """, unsafe_allow_html=True)
 
@@ -56,7 +71,6 @@ MISSPELLING_SUGGESTIONS = {
     "dentel": "dental", 
     "dentle": "dental",
     "pediatrik": "pediatric",
-    "pediatrik": "pediatric",
     "terapy": "therapy",
     "theraphy": "therapy",
     "klinik": "clinic",
@@ -81,6 +95,15 @@ MISSPELLING_SUGGESTIONS = {
     "cloes": "close",
 }
 
+# One alternation over every known misspelling, so a query is scanned once
+_MISSPELL_RE = re.compile(r'\b(' + '|'.join(map(re.escape, MISSPELLING_SUGGESTIONS)) + r')\b')
+
+def _misspell_sub(match: re.Match) -> str:
+    return MISSPELLING_SUGGESTIONS[match.group(1)]
+
+# Category labels are used as dict keys throughout session state
+CATEGORIES = tuple(sys.intern(c) for c in ("Healthcare", "Education", "Resettlement / Legal / Shelter"))
+
 DATA_SOURCES = {
     "Healthcare": [
         "https://raw.githubusercontent.com/mowaffak-alraiyes/refugee-resources/main/resources/healthcare.txt",
@@ -125,65 +148,257 @@ BASE_SYNONYMS = {
     },
 }
 
+# Freeze the groups so they can be shared and used as cache keys
+BASE_SYNONYMS = {
+    group: {key: frozenset(syns) for key, syns in synonyms.items()}
+    for group, synonyms in BASE_SYNONYMS.items()
+}
+
+def _synonym_index(category: str) -> Dict[str, frozenset]:
+    """Map each query word to its full expansion: the union of every synonym group
+    (key included) it triggers for a category."""
+    cat_syns = {}
+    cat_syns.update(BASE_SYNONYMS.get("common", {}))
+    cat_syns.update(BASE_SYNONYMS.get(category, {}))
+    index = {}
+    for key, syns in cat_syns.items():
+        group = syns | {key}
+        for token in group:
+            index.setdefault(token, set()).update(group)
+    return {token: frozenset(expansion) for token, expansion in index.items()}
+
+# One index per category; "common" alone serves any other category
+SYNONYM_INDEX = {category: _synonym_index(category) for category in BASE_SYNONYMS}
+
+# One bit per synonym term. prepare_item records which terms occur in an item's
+# search blob, so counting matched terms in rank_items is an AND plus a popcount.
+_TERM_BITS = {
+    term: 1 << i
+    for i, term in enumerate(sorted({
+        term
+        for synonyms in BASE_SYNONYMS.values()
+        for key, syns in synonyms.items()
+        for term in (key, *syns)
+    }))
+}
+
+# Keywords for detect_service_from_query (per category) and detect_day_from_query.
+# Within each kind, the first listed label that matches wins.
+SERVICE_KEYWORDS = {
+    "Healthcare": [
+        ("dental", ["dental", "dentist", "teeth", "tooth", "oral"]),
+        ("pediatric", ["pediatric", "children", "child", "kid", "kids", "youth"]),
+        ("mental health", ["mental", "counseling", "therapy", "psychiatry"]),
+        ("women's health", ["women", "obgyn", "prenatal", "midwifery"]),
+        ("immunization", ["immunization", "vaccination", "shots", "vaccine"]),
+    ],
+    "Education": [
+        ("ESL", ["esl", "english", "language", "tutoring", "classes"]),
+        ("GED/Citizenship", ["ged", "citizenship", "literacy"]),
+        ("Youth Programs", ["after-school", "after school", "youth"]),
+    ],
+    "Resettlement / Legal / Shelter": [
+        ("Legal Services", ["legal", "law", "attorney", "immigration", "asylum", "daca"]),
+        ("Shelter/Housing", ["shelter", "housing", "emergency", "homeless"]),
+        ("Benefits Assistance", ["benefits", "snap", "medicaid", "cash assistance"]),
+        ("Resettlement Services", ["resettlement", "case management", "employment", "job"]),
+    ],
+}
+
+DAY_KEYWORDS = [
+    ("Monday", ["monday", "mon"]),
+    ("Tuesday", ["tuesday", "tue", "tues"]),
+    ("Wednesday", ["wednesday", "wed"]),
+    ("Thursday", ["thursday", "thu", "thurs"]),
+    ("Friday", ["friday", "fri"]),
+    ("Saturday", ["saturday", "sat"]),
+    ("Sunday", ["sunday", "sun"]),
+]
+
+# Flattened (keyword, kind, label, priority); kind is a category name or "day"
+_KEYWORD_TABLE = [
+    (keyword, kind, label, priority)
+    for kind, groups in [*SERVICE_KEYWORDS.items(), ("day", DAY_KEYWORDS)]
+    for priority, (label, keywords) in enumerate(groups)
+    for keyword in keywords
+]
+
+_KEYWORD_HITS = {}
+for _keyword, _kind, _label, _priority in _KEYWORD_TABLE:
+    _KEYWORD_HITS.setdefault(_keyword, []).append((_kind, _label, _priority))
+
+# One scanner for every query detector: ZIPs, misspellings, and service/day keywords.
+# Keywords sit in a lookahead so they may overlap other matches (and each other);
+# longest-first ordering is exact because every prefix keyword shares its hits.
+_QUERY_SCANNER = re.compile(
+    r"(?=(?P<keyword>" + "|".join(map(re.escape, sorted(_KEYWORD_HITS, key=len, reverse=True))) + r"))"
+    r"|\b(?P<zip>60\d{3})\b"
+    # Misspellings are whole whitespace-separated words, as in the original query.split()
+    # check, so "dentall," or "tues-clinik" are not flagged
+    r"|(?<!\S)(?P<misspell>" + "|".join(map(re.escape, MISSPELLING_SUGGESTIONS)) + r")(?!\S)"
+)
+
+# Patterns used on every parse/query, compiled once
+_ZIP_RE = re.compile(r"\b(60\d{3})\b")
+_SPACES_RE = re.compile(r"\s+")
+_WORD_RE = re.compile(r"[a-zA-Z]+")
+_NON_DIGIT_RE = re.compile(r"\D")
+_CLINIC_RE = re.compile(r"\bclinic(s)?\b", re.IGNORECASE)
+_LIST_SPLIT_RE = re.compile(r"[;,]")
+
+_BLOCK_HEAD_RE = re.compile(r"^\s*(\d+)\.\s+(.+)", re.MULTILINE)
+_NUMBER_PREFIX_RE = re.compile(r"^\s*\d+\.\s*")
+_ADDR_RE = re.compile(r"📍\s*(.+)", re.IGNORECASE)
+_WEBSITE_RE = re.compile(r"🌐\s*(https?://\S+)", re.IGNORECASE)
+_LANG_RE = re.compile(r"🗣\s*Languages:\s*(.+)", re.IGNORECASE)
+_SERVICES_EMOJI_RE = re.compile(r"(?:🏥|🛟|🛠️|🧰)\s*Services:\s*(.+)", re.IGNORECASE)
+_SERVICES_RE = re.compile(r"Services:\s*(.+)", re.IGNORECASE)
+_HOURS_EMOJI_RE = re.compile(r"⏰\s*Hours:\s*(.+)", re.IGNORECASE)
+_HOURS_RE = re.compile(r"Hours:\s*(.+)", re.IGNORECASE)
+_PHONE_EMOJI_RE = re.compile(r"📞\s*(.+)", re.IGNORECASE)
+_PHONE_RE = re.compile(r"Phone:\s*(.+)", re.IGNORECASE)
+
+_DAY_RANGE_RE = re.compile(r"\b(mon|tue|tues|wed|thu|thurs|fri|sat|sun)\s*[-–]\s*(mon|tue|tues|wed|thu|thurs|fri|sat|sun)\b")
+_DAY_ABBR_RE = re.compile(r"\b(mon|tue|tues|wed|thu|thurs|fri|sat|sun)\b")
+
+# Service groups, used both as must-have filters and for the ranking bonus
+_PAT_DENTAL = re.compile(r"\b(dental|dentist|oral)\b", re.IGNORECASE)
+_PAT_PEDIATRIC = re.compile(r"\b(pediatric|children|youth|adolescent)\b", re.IGNORECASE)
+_PAT_LEGAL = re.compile(r"\b(legal|immigration|asylum|daca)\b", re.IGNORECASE)
+_PAT_ESL = re.compile(r"\b(esl|english|literacy|ged|citizenship)\b", re.IGNORECASE)
+_PAT_SHELTER = re.compile(r"\b(shelter|housing|emergency)\b", re.IGNORECASE)
+_SERVICE_BONUS_PATTERNS = (_PAT_DENTAL, _PAT_PEDIATRIC, _PAT_LEGAL, _PAT_ESL, _PAT_SHELTER)
+# One bit per service pattern; items store which ones their Services text matches
+_SERVICE_PATTERN_BITS = {pat: 1 << i for i, pat in enumerate(_SERVICE_BONUS_PATTERNS)}
+
+def service_bits(text: str, patterns=_SERVICE_BONUS_PATTERNS) -> int:
+    """Bitmask of the given service patterns found in text."""
+    bits = 0
+    for pat in patterns:
+        if pat.search(text):
+            bits |= _SERVICE_PATTERN_BITS[pat]
+    return bits
+
 # ===========================
 # Utilities
 # ===========================
+@st.cache_resource(show_spinner=False)
+def _http_client():
+    """One keep-alive session for all dataset downloads, plus url -> (etag, last_modified, text)
+    of the last successful download for conditional GETs.
+    
+    requests is imported here, so runs served from the local JSON data never load it.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    validators: Dict[str, Tuple[str, str, str]] = {}
+    return session, validators
+
+def _fetch_url(url: str) -> str:
+    """GET a URL, reusing the previous body when the server answers 304 Not Modified."""
+    session, validators = _http_client()
+    headers = {}
+    cached = validators.get(url)
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    r = session.get(url, timeout=20, headers=headers)
+    if r.status_code == 304 and cached:
+        return cached[2]
+    r.raise_for_status()
+    validators[url] = (r.headers.get("ETag", ""), r.headers.get("Last-Modified", ""), r.text)
+    return r.text
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _read_source(src: str, mtime: float) -> str:
+    """Text of one source; mtime is part of the cache key so edited files are re-read."""
+    if src.startswith("http"):
+        return _fetch_url(src)
+    with open(src, "r", encoding="utf-8") as f:
+        return f.read()
+
 def fetch_text_from_sources(sources: List[str]) -> str:
     last_err = None
     for src in sources:
         try:
-            if src.startswith("http"):
-                r = requests.get(src, timeout=20)
-                r.raise_for_status()
-                if r.text.strip():
-                    return r.text
-            else:
-                with open(src, "r", encoding="utf-8") as f:
-                    text = f.read()
-                    if text.strip():
-                        return text
+            mtime = 0.0 if src.startswith("http") else os.path.getmtime(src)
+            text = _read_source(src, mtime)
+            if text.strip():
+                return text
         except Exception as e:
             last_err = e
             continue
     raise RuntimeError(f"Failed to load dataset from any source. Last error: {last_err}")
 
-def first_match(pat: str, text: str) -> str:
-    m = re.search(pat, text, flags=re.IGNORECASE)
+def first_match(pat: re.Pattern, text: str) -> str:
+    m = pat.search(text)
     return m.group(1).strip() if m else ""
 
+def _is_block_head(line: str, more_lines: bool) -> bool:
+    """True if line opens a numbered block ("NN. Name"); a bare "NN." needs a following line."""
+    dot = line.find(".")
+    if dot < 1 or not line[:dot].isdecimal():
+        return False
+    after = line[dot + 1:dot + 2]
+    return after.isspace() if after else more_lines
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Lines of text split on "\\n" only, without building a list of them."""
+    for line in io.StringIO(text, newline="\n"):
+        yield line[:-1] if line.endswith("\n") else line
+
+def iter_blocks(lines: Iterable[str]) -> Iterator[str]:
+    """Yield numbered blocks one at a time from a stream of lines."""
+    it = iter(lines)
+    line = next(it, None)
+    cur = []
+    while line is not None:
+        # One line of lookahead: a bare "NN." only opens a block if something follows it
+        following = next(it, None)
+        if cur and _is_block_head(line, following is not None):
+            yield "\n".join(cur)
+            cur = []
+        cur.append(line)
+        line = following
+    if cur:
+        yield "\n".join(cur)
+
 def parse_blocks(resource_text: str) -> List[Dict]:
     # Split each numbered block "NN. Name"
-    blocks = re.split(r"\n(?=\d+\.\s)|\A(?=\d+\.\s)", resource_text.strip())
     out = []
-    for blk in blocks:
+    for blk in iter_blocks(_iter_lines(resource_text.strip())):
         if not blk.strip():
             continue
-        m = re.match(r"^\s*(\d+)\.\s+(.+)", blk.strip(), flags=re.MULTILINE)
+        m = _BLOCK_HEAD_RE.match(blk.strip())
         if m:
             item_id = m.group(1).strip()
             name = m.group(2).strip()
         else:
             first_line = blk.strip().splitlines()[0].strip()
             item_id = str(len(out) + 1)
-            name = re.sub(r"^\s*\d+\.\s*", "", first_line)
+            name = _NUMBER_PREFIX_RE.sub("", first_line)
 
-        address   = first_match(r"📍\s*(.+)", blk)
-        website   = first_match(r"🌐\s*(https?://\S+)", blk)
-        languages = first_match(r"🗣\s*Languages:\s*(.+)", blk)
+        address   = first_match(_ADDR_RE, blk)
+        website   = first_match(_WEBSITE_RE, blk)
+        languages = first_match(_LANG_RE, blk)
         # Multiple emoji fallbacks for Services
-        services  = (first_match(r"(?:🏥|🛟|🛠️|🧰)\s*Services:\s*(.+)", blk) or 
-                    first_match(r"Services:\s*(.+)", blk))
+        services  = (first_match(_SERVICES_EMOJI_RE, blk) or 
+                    first_match(_SERVICES_RE, blk))
         # Multiple fallbacks for Hours
-        hours     = (first_match(r"⏰\s*Hours:\s*(.+)", blk) or 
-                    first_match(r"Hours:\s*(.+)", blk))
-        # Multiple fallbacks for Phone
-        phone     = (first_match(r"📞\s*(.+)", blk) or 
-                    first_match(r"Phone:\s*(.+)", blk) or
-                    first_match(r"📞\s*Phone:\s*(.+)", blk))
+        hours     = (first_match(_HOURS_EMOJI_RE, blk) or 
+                    first_match(_HOURS_RE, blk))
+        # Multiple fallbacks for Phone ("📞 Phone: ..." is already covered by the emoji pattern)
+        phone     = (first_match(_PHONE_EMOJI_RE, blk) or 
+                    first_match(_PHONE_RE, blk))
         # Search for zip in full block if address is missing
-        zip_code  = first_match(r"\b(60\d{3})\b", address or blk)
+        zip_code  = first_match(_ZIP_RE, address or blk)
 
-        out.append({
+        out.append(prepare_item({
             "id": item_id,
             "name": name,
             "address": address,
@@ -194,29 +409,46 @@ def parse_blocks(resource_text: str) -> List[Dict]:
             "hours": hours,
             "phone": phone,
             "_search_blob": " ".join([name or "", address or "", languages or "", services or ""]).lower(),
-        })
+        }))
     return out
 
+@lru_cache(maxsize=128)
+def _scan_query(query_lower: str) -> Tuple[str, Tuple[str, ...], Mapping[str, str]]:
+    """First ZIP, misspelled words, and best-priority label per kind.
+    The result is shared by every caller through the cache, so the labels are a read-only view."""
+    first_zip = None
+    misspelled = []
+    best = {}
+    for m in _QUERY_SCANNER.finditer(query_lower):
+        keyword = m.group("keyword")
+        if keyword is not None:
+            for kind, label, priority in _KEYWORD_HITS[keyword]:
+                if kind not in best or priority < best[kind][1]:
+                    best[kind] = (label, priority)
+        elif m.group("zip") is not None:
+            if first_zip is None:
+                first_zip = m.group("zip")
+        else:
+            misspelled.append(m.group("misspell"))
+    return first_zip, tuple(misspelled), MappingProxyType({kind: label for kind, (label, _) in best.items()})
+
 def detect_misspellings(query: str) -> List[Tuple[str, str]]:
     """Detect misspellings in the query and return (misspelled_word, suggested_correction) pairs."""
     if not query:
         return []
     
-    suggestions = []
-    words = query.lower().split()
-    
-    for word in words:
-        if word in MISSPELLING_SUGGESTIONS:
-            suggestions.append((word, MISSPELLING_SUGGESTIONS[word]))
-    
-    return suggestions
+    return [(word, MISSPELLING_SUGGESTIONS[word]) for word in _scan_query(query.lower())[1]]
 
-def detect_zip_from_query(query: str) -> str:
+def correct(query: str) -> str:
+    """Lowercase the query and replace every known misspelling in a single pass."""
+    return _MISSPELL_RE.sub(_misspell_sub, query.lower())
+
+def detect_zip_from_query(query: str, query_lower: str = None) -> str:
     """Auto-detect ZIP code or neighborhood from search query and return it if found."""
     # First, check for ZIP code (60xxx format for Chicago area)
-    zip_match = re.search(r'\b(60\d{3})\b', query)
-    if zip_match:
-        return zip_match.group(1)
+    zip_code = _scan_query(query_lower if query_lower is not None else query.lower())[0]
+    if zip_code:
+        return zip_code
     
     # Then check for neighborhood name
     cleaned_query, zips = neighborhood_mapping.expand_neighborhood_query(query)
@@ -226,194 +458,126 @@ def detect_zip_from_query(query: str) -> str:
     
     return None
 
-def clean_query_of_zip(query: str) -> str:
-    """Remove ZIP code from query text to avoid double-counting in search."""
-    # Remove 5-digit ZIP codes from query
-    cleaned = re.sub(r'\b(60\d{3})\b', '', query)
-    # Clean up extra spaces
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-    return cleaned
-
 def detect_service_from_query(query: str, category: str) -> str:
     """Auto-detect service type from search query and return it if found."""
-    query_lower = query.lower()
-    
-    # Healthcare services
-    if category == "Healthcare":
-        if any(word in query_lower for word in ["dental", "dentist", "teeth", "tooth", "oral"]):
-            return "dental"
-        elif any(word in query_lower for word in ["pediatric", "children", "child", "kid", "kids", "youth"]):
-            return "pediatric"
-        elif any(word in query_lower for word in ["mental", "counseling", "therapy", "psychiatry"]):
-            return "mental health"
-        elif any(word in query_lower for word in ["women", "obgyn", "prenatal", "midwifery"]):
-            return "women's health"
-        elif any(word in query_lower for word in ["immunization", "vaccination", "shots", "vaccine"]):
-            return "immunization"
-    
-    # Education services
-    elif category == "Education":
-        if any(word in query_lower for word in ["esl", "english", "language", "tutoring", "classes"]):
-            return "ESL"
-        elif any(word in query_lower for word in ["ged", "citizenship", "literacy"]):
-            return "GED/Citizenship"
-        elif any(word in query_lower for word in ["after-school", "after school", "youth"]):
-            return "Youth Programs"
-    
-    # Legal/Shelter services
-    elif category == "Resettlement / Legal / Shelter":
-        if any(word in query_lower for word in ["legal", "law", "attorney", "immigration", "asylum", "daca"]):
-            return "Legal Services"
-        elif any(word in query_lower for word in ["shelter", "housing", "emergency", "homeless"]):
-            return "Shelter/Housing"
-        elif any(word in query_lower for word in ["benefits", "snap", "medicaid", "cash assistance"]):
-            return "Benefits Assistance"
-        elif any(word in query_lower for word in ["resettlement", "case management", "employment", "job"]):
-            return "Resettlement Services"
-    
-    return None
+    return _scan_query(query.lower())[2].get(category)
 
 def detect_day_from_query(query: str) -> str:
     """Auto-detect day of week from search query and return it if found."""
+    return _scan_query(query.lower())[2].get("day")
+
+def detect_query_filters(query: str, category: str) -> Tuple[str, str, str]:
+    """Detected (zip, service, day) for a query, lowercasing and scanning it once."""
     query_lower = query.lower()
-    
-    days = {
-        "monday": "Monday", "mon": "Monday",
-        "tuesday": "Tuesday", "tue": "Tuesday", "tues": "Tuesday",
-        "wednesday": "Wednesday", "wed": "Wednesday",
-        "thursday": "Thursday", "thu": "Thursday", "thurs": "Thursday",
-        "friday": "Friday", "fri": "Friday",
-        "saturday": "Saturday", "sat": "Saturday",
-        "sunday": "Sunday", "sun": "Sunday"
-    }
-    
-    for day_key, day_value in days.items():
-        if day_key in query_lower:
-            return day_value
-    
-    return None
+    labels = _scan_query(query_lower)[2]
+    return detect_zip_from_query(query, query_lower), labels.get(category), labels.get("day")
 
 # QR code generation function removed - not necessary
 
-def parse_day_ranges(hours_input) -> List[str]:
+# One bit per weekday, so day filters are a single AND per item
+DAY_BITS = {
+    "Monday": 1, "Tuesday": 2, "Wednesday": 4, "Thursday": 8,
+    "Friday": 16, "Saturday": 32, "Sunday": 64
+}
+_DAY_NAMES = tuple(DAY_BITS)
+_DAY_KEYS = tuple(day.lower() for day in _DAY_NAMES)
+_ALL_DAYS = 0x7F
+
+# Weekday index of the abbreviations matched by _DAY_RANGE_RE / _DAY_ABBR_RE
+_DAY_IDX = {"mon": 0, "tue": 1, "tues": 1, "wed": 2, "thu": 3, "thurs": 3, "fri": 4, "sat": 5, "sun": 6}
+
+def parse_day_mask(hours_input) -> int:
     """
-    Parse day ranges from hours data.
+    Parse day ranges from hours data into a DAY_BITS mask.
     Handles both structured dict format (from JSON) and string format (from .txt files).
     """
-    available_days = []
+    mask = 0
     
     # Handle structured dict format (from JSON files)
     if isinstance(hours_input, dict):
-        day_map = {
-            "monday": "Monday",
-            "tuesday": "Tuesday", 
-            "wednesday": "Wednesday",
-            "thursday": "Thursday",
-            "friday": "Friday",
-            "saturday": "Saturday",
-            "sunday": "Sunday"
-        }
-        for day_key, day_value in day_map.items():
-            if day_key in hours_input and hours_input[day_key]:
-                available_days.append(day_value)
-        return available_days
+        for i, day_key in enumerate(_DAY_KEYS):
+            if hours_input.get(day_key):
+                mask |= 1 << i
+        return mask
     
     # Handle string format (from .txt files or hours_text)
     if not isinstance(hours_input, str):
-        return []
-    
-    hours_lower = hours_input.lower()
+        return 0
+    return _parse_day_mask_text(hours_input)
+
+@lru_cache(maxsize=2048)
+def _parse_day_mask_text(hours_text: str) -> int:
+    """parse_day_mask for hours text; the same hours lines repeat across many resources."""
+    mask = 0
+    hours_lower = hours_text.lower()
     
-    # Day mapping for abbreviations
-    day_map = {
-        "mon": "Monday", "tue": "Tuesday", "tues": "Tuesday", "wed": "Wednesday",
-        "thu": "Thursday", "thurs": "Thursday", "fri": "Friday", "sat": "Saturday", "sun": "Sunday"
-    }
-    
-    # Look for day ranges like "Mon-Thu" or "Mon - Thu"
-    range_pattern = r'\b(mon|tue|tues|wed|thu|thurs|fri|sat|sun)\s*[-–]\s*(mon|tue|tues|wed|thu|thurs|fri|sat|sun)\b'
-    range_matches = re.findall(range_pattern, hours_lower)
-    
-    for start_day, end_day in range_matches:
-        start_idx = list(day_map.keys()).index(start_day)
-        end_idx = list(day_map.keys()).index(end_day)
-        
-        # Handle wrapping around (e.g., Fri-Mon)
-        if start_idx <= end_idx:
-            day_range = list(day_map.keys())[start_idx:end_idx + 1]
+    # Day ranges like "Mon-Thu" or "Mon - Thu", wrapping around the week for "Fri-Mon"
+    for start_day, end_day in _DAY_RANGE_RE.findall(hours_lower):
+        start, end = _DAY_IDX[start_day], _DAY_IDX[end_day]
+        if start <= end:
+            mask |= (2 << end) - (1 << start)
         else:
-            day_range = list(day_map.keys())[start_idx:] + list(day_map.keys())[:end_idx + 1]
-        
-        for day in day_range:
-            available_days.append(day_map[day])
-    
-    # Look for individual days or comma-separated lists
-    individual_pattern = r'\b(mon|tue|tues|wed|thu|thurs|fri|sat|sun)\b'
-    individual_matches = re.findall(individual_pattern, hours_lower)
+            mask |= ((2 << end) - 1) | (_ALL_DAYS & (_ALL_DAYS << start))
     
-    for day in individual_matches:
-        if day_map[day] not in available_days:  # Avoid duplicates
-            available_days.append(day_map[day])
+    # Individual days or comma-separated lists
+    for day in _DAY_ABBR_RE.findall(hours_lower):
+        mask |= 1 << _DAY_IDX[day]
     
-    # Look for full day names
-    full_days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-    for full_day in full_days:
-        if full_day in hours_lower and full_day.capitalize() not in available_days:
-            available_days.append(full_day.capitalize())
+    # Full day names
+    for i, day_key in enumerate(_DAY_KEYS):
+        if day_key in hours_lower:
+            mask |= 1 << i
     
-    return available_days
+    return mask
 
-def is_day_available_in_dataset(day: str, items: List[Dict]) -> bool:
-    """Check if a specific day is actually available in the dataset."""
-    if not day or day == "All":
-        return False
-    
-    day_lower = day.lower()
-    for item in items:
+def parse_day_ranges(hours_input) -> List[str]:
+    """Day names (Monday first) found in hours data; see parse_day_mask."""
+    mask = parse_day_mask(hours_input)
+    return [day for i, day in enumerate(_DAY_NAMES) if mask >> i & 1]
+
+def day_mask(days) -> int:
+    """Combine day names into a DAY_BITS mask (unknown names contribute nothing)."""
+    mask = 0
+    for day in days:
+        mask |= DAY_BITS.get(day, 0)
+    return mask
+
+def item_day_mask(item: Dict) -> int:
+    """Mask of the days an item is open, parsed from its hours once and kept on the item."""
+    mask = item.get("_day_mask")
+    if mask is None:
         # Try hours_text first (from .txt), then structured hours
         hours = item.get("hours_text") or item.get("hours") or ""
-        if hours:
-            # Use the smart parsing to get all available days (handles both dict and string)
-            available_days = parse_day_ranges(hours)
-            # Check if the requested day is in the available days
-            if day in available_days:
-                return True
-    
-    return False
-
-def clean_query_of_service_and_day(query: str, detected_service: str = None, detected_day: str = None) -> str:
-    """Remove detected service and day from query text to avoid double-counting in search."""
-    cleaned = query
-    
-    if detected_service:
-        # Remove service-related words
-        service_words = detected_service.lower().split()
-        for word in service_words:
-            cleaned = re.sub(rf'\b{re.escape(word)}\b', '', cleaned, flags=re.IGNORECASE)
-    
-    if detected_day:
-        # Remove day-related words
-        day_words = detected_day.lower().split()
-        for word in day_words:
-            cleaned = re.sub(rf'\b{re.escape(word)}\b', '', cleaned, flags=re.IGNORECASE)
-    
-    # Clean up extra spaces
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-    return cleaned
-
-def expand_terms(query: str, category: str) -> List[str]:
+        mask = parse_day_mask(hours) if hours else 0
+        item["_day_mask"] = mask
+    return mask
+
+@lru_cache(maxsize=128)
+def _cleanup_pattern(words: Tuple[str, ...], with_zip: bool) -> re.Pattern:
+    """Whole-word alternation over the words to strip (plus ZIP codes if asked)."""
+    alternatives = [re.escape(word) for word in words]
+    if with_zip:
+        alternatives.insert(0, r"60\d{3}")
+    return re.compile(r"\b(?:" + "|".join(alternatives) + r")\b", re.IGNORECASE)
+
+def clean_query_of_detected(query: str, detected_zip: str = None, detected_service: str = None, detected_day: str = None) -> str:
+    """Remove detected ZIP, service and day words from query text to avoid double-counting in search."""
+    words = tuple(dict.fromkeys(f"{detected_service or ''} {detected_day or ''}".lower().split()))
+    # One substitution for every detected word, then one whitespace cleanup
+    if words or detected_zip:
+        query = _cleanup_pattern(words, bool(detected_zip)).sub('', query)
+    return _SPACES_RE.sub(' ', query).strip()
+
+@lru_cache(maxsize=2048)
+def expand_terms(query: str, category: str) -> Tuple[str, ...]:
     q = (query or "").lower()
-    words = set(re.findall(r"[a-zA-Z]+", q))
+    words = set(_WORD_RE.findall(q))
     expanded = set(words)
 
-    cat_syns = {}
-    cat_syns.update(BASE_SYNONYMS.get("common", {}))
-    cat_syns.update(BASE_SYNONYMS.get(category, {}))
-    for key, syns in cat_syns.items():
-        if (key in words) or (words & syns):
-            expanded |= syns
-            expanded.add(key)
-    return sorted(expanded)
+    index = SYNONYM_INDEX.get(category, SYNONYM_INDEX["common"])
+    for word in words:
+        expanded |= index.get(word, frozenset())
+    return tuple(sorted(expanded))
 
 def must_have_patterns(terms: List[str], category: str) -> List[re.Pattern]:
     """If user asked for a specific service, require it to appear in Services text."""
@@ -421,127 +585,202 @@ def must_have_patterns(terms: List[str], category: str) -> List[re.Pattern]:
     t = set(terms)
     if category == "Healthcare":
         if {"dental","dentist","oral","tooth","teeth"} & t:
-            pats.append(re.compile(r"\b(dental|dentist|oral)\b"))
+            pats.append(_PAT_DENTAL)
         if {"pediatric","children","youth","adolescent","kid","kids"} & t:
-            pats.append(re.compile(r"\b(pediatric|children|youth|adolescent)\b"))
+            pats.append(_PAT_PEDIATRIC)
     if category == "Resettlement / Legal / Shelter":
         if {"legal","immigration","asylum","daca"} & t:
-            pats.append(re.compile(r"\b(legal|immigration|asylum|daca)\b"))
+            pats.append(_PAT_LEGAL)
         if {"shelter","housing","homeless","emergency"} & t:
-            pats.append(re.compile(r"\b(shelter|housing|emergency)\b"))
+            pats.append(_PAT_SHELTER)
     if category == "Education":
         if {"esl","english","literacy","ged","citizenship"} & t:
-            pats.append(re.compile(r"\b(esl|english|literacy|ged|citizenship)\b"))
+            pats.append(_PAT_ESL)
     return pats
 
-def rank_items(items: List[Dict], query: str, category: str, zip_filter: str, lang_filter: str, service_filter: str = "All", day_filter: str = "All") -> List[Tuple[int, Dict]]:
-    terms = expand_terms(query, category)
-    require = must_have_patterns(terms, category)
+def _lowered(value) -> Tuple[str, ...]:
+    """Lowercase a list field, or a legacy string field as a single entry (interned: the same
+    labels repeat across items and are matched against filter values)."""
+    if isinstance(value, list):
+        return tuple(sys.intern(v.lower()) for v in value)
+    return (sys.intern((value or "").lower()),)
 
-    ranked = []
+def prepare_item(c: Dict) -> Dict:
+    """Attach the normalized fields rank_items reads, so they are built once per load.
+    
+    Handles both structured items (lists, from data_loader) and parse_blocks items (strings).
+    """
+    # Handle search_blob - use structured data if available
+    blob = c.get("search_blob") or c.get("_search_blob", "")
+    
+    # Build search blob from structured data if not present
+    if not blob and isinstance(c.get("services"), list):
+        blob_parts = [
+            c.get("name", ""),
+            c.get("address", ""),
+            " ".join(c.get("services", [])),
+            " ".join(c.get("subcategories", [])),
+            " ".join(c.get("languages", []))
+        ]
+        blob = " ".join(blob_parts).lower()
+    c["_search_blob"] = blob
+    
+    term_bits = 0
+    for term, bit in _TERM_BITS.items():
+        if term in blob:
+            term_bits |= bit
+    c["_term_bits"] = term_bits
+    
+    # Services text for matching
+    if isinstance(c.get("services"), list):
+        c["_svc_lower"] = " ".join(c.get("services", [])).lower()
+    else:
+        c["_svc_lower"] = (c.get("services_text") or c.get("services") or "").lower()
+    c["_svc_bits"] = service_bits(c["_svc_lower"])
+    
+    # Filter fields - "zip" (old format) or "zip_code" (new format)
+    c["_zip"] = c.get("zip_code") or c.get("zip")
+    c["_langs_lower"] = _lowered(c.get("languages", []))
+    c["_services_lower"] = _lowered(c.get("services", []))
+    item_day_mask(c)
+    return c
+
+def bit_matrix(masks: List[int], width: int) -> np.ndarray:
+    """Boolean (items x bits) matrix: row i, column j is bit j of masks[i]."""
+    matrix = np.zeros((len(masks), width), dtype=bool)
+    for row, mask in enumerate(masks):
+        while mask:
+            low = mask & -mask
+            matrix[row, low.bit_length() - 1] = True
+            mask ^= low
+    return matrix
+
+def bit_columns(mask: int) -> List[int]:
+    """Positions of the set bits in mask, i.e. the bit_matrix columns it selects."""
+    return [j for j in range(mask.bit_length()) if mask >> j & 1]
+
+def blobs_containing(index: Dict, term: str) -> np.ndarray:
+    """Boolean column: which items' search blobs contain term (as a substring)."""
+    found = np.zeros(index["size"], dtype=bool)
+    # Each match runs on to the end of its blob, so there is at most one per item
+    matches = re.finditer(re.escape(term) + "[^\0]*", index["blob_text"])
+    hits = np.fromiter((m.start() for m in matches), dtype=np.intp)
+    found[np.searchsorted(index["blob_starts"], hits, side="right") - 1] = True
+    return found
+
+def build_filter_index(items: List[Dict]) -> Dict:
+    """Map each filter value to the positions of the items that carry it, and keep the
+    fields scoring reads as parallel columns.
+    
+    rank_items intersects these lists instead of testing every item against every filter,
+    then scores the candidates column-wise (NumPy) without touching the item dicts.
+    """
+    index = {"size": len(items), "zip": {}, "no_zip": [], "langs": {}, "services": {}, "days": {}}
     for c in items:
-        # ZIP filter - handle both "zip" (old format) and "zip_code" (new format)
-        if zip_filter != "All":
-            item_zip = c.get("zip_code") or c.get("zip")
-            if item_zip and item_zip != zip_filter:
-                continue
-        
-        # Language filter - handle both list (new format) and string (old format)
-        if lang_filter != "All":
-            item_langs = c.get("languages", [])
-            if isinstance(item_langs, list):
-                # Structured format: list of languages
-                lang_match = any(lang_filter.lower() in lang.lower() for lang in item_langs)
-            else:
-                # Old format: string
-                lang_match = lang_filter.lower() in (item_langs or "").lower()
-            if not lang_match:
-                continue
-        
-        # Service filter - handle both list (new format) and string (old format)
-        if service_filter != "All":
-            item_services = c.get("services", [])
-            if isinstance(item_services, list):
-                # Structured format: list of services
-                service_match = any(service_filter.lower() in service.lower() for service in item_services)
-            else:
-                # Old format: string
-                service_match = service_filter.lower() in (item_services or "").lower()
-            if not service_match:
-                continue
-        # Day filter - try hours_text first (from .txt), then structured hours
-        if day_filter != "All":
-            hours = c.get("hours_text") or c.get("hours") or ""
-            if hours:
-                # Use smart parsing to get available days (handles both dict and string)
-                available_days = parse_day_ranges(hours)
-                if day_filter not in available_days:
-                    continue
-            else:
-                # No hours data, skip this item
-                continue
-
-        # Handle search_blob - use structured data if available
-        blob = c.get("search_blob") or c.get("_search_blob", "")
-        
-        # Build search blob from structured data if not present
-        if not blob and isinstance(c.get("services"), list):
-            blob_parts = [
-                c.get("name", ""),
-                c.get("address", ""),
-                " ".join(c.get("services", [])),
-                " ".join(c.get("subcategories", [])),
-                " ".join(c.get("languages", []))
-            ]
-            blob = " ".join(blob_parts).lower()
-        
-        # Handle services text for matching
-        if isinstance(c.get("services"), list):
-            svc = " ".join(c.get("services", [])).lower()
+        if "_svc_lower" not in c:
+            prepare_item(c)
+    index["names"] = np.array([c["name"] for c in items], dtype=str)
+    # All blobs in one string, so a query word is found in every item with one scan
+    index["blob_text"] = "\0".join(c["_search_blob"] for c in items)
+    index["blob_starts"] = np.cumsum([0] + [len(c["_search_blob"]) + 1 for c in items[:-1]], dtype=np.intp)
+    index["term_hits"] = bit_matrix([c["_term_bits"] for c in items], len(_TERM_BITS))
+    index["svc_hits"] = bit_matrix([c["_svc_bits"] for c in items], len(_SERVICE_PATTERN_BITS))
+    for pos, c in enumerate(items):
+        if c["_zip"]:
+            index["zip"].setdefault(c["_zip"], []).append(pos)
         else:
-            svc = (c.get("services_text") or c.get("services") or "").lower()
-
-        # If user asked for specific service(s), require them in Services
-        if require and not all(p.search(svc) for p in require):
-            continue
-
-        # Base score + small bonuses
-        score = sum(1 for t in terms if t in blob) if terms else 1
-        if re.search(r"\b(dental|dentist|oral)\b", query, re.I) and re.search(r"\b(dental|dentist|oral)\b", svc):
-            score += 2
-        if re.search(r"\b(pediatric|children|youth|adolescent)\b", query, re.I) and re.search(r"\b(pediatric|children|youth|adolescent)\b", svc):
-            score += 2
-        if re.search(r"\b(legal|immigration|asylum|daca)\b", query, re.I) and re.search(r"\b(legal|immigration|asylum|daca)\b", svc):
-            score += 2
-        if re.search(r"\b(esl|english|literacy|ged|citizenship)\b", query, re.I) and re.search(r"\b(esl|english|literacy|ged|citizenship)\b", svc):
-            score += 2
-        if re.search(r"\b(shelter|housing|emergency)\b", query, re.I) and re.search(r"\b(shelter|housing|emergency)\b", svc):
-            score += 2
-
-        if score > 0:
-            ranked.append((score, c))
-
-    ranked.sort(key=lambda x: (-x[0], x[1]["name"]))
-    return ranked
+            index["no_zip"].append(pos)
+        for lang in set(c["_langs_lower"]):
+            index["langs"].setdefault(lang, []).append(pos)
+        for service in set(c["_services_lower"]):
+            index["services"].setdefault(service, []).append(pos)
+        index["days"].setdefault(c["_day_mask"], []).append(pos)
+    return index
+
+def filter_candidates(index: Dict, zip_filter: str, lang_filter: str, service_filter: str, day_filter: str):
+    """Sorted positions of items passing the filters, or None when no filter is set."""
+    candidates = None
+    
+    def narrow(positions):
+        nonlocal candidates
+        candidates = positions if candidates is None else candidates & positions
+    
+    # Items without a ZIP are kept under any ZIP filter
+    if zip_filter != "All":
+        narrow(set(index["zip"].get(zip_filter, ())) | set(index["no_zip"]))
+    # Language and service filters match as substrings of the item's values
+    if lang_filter != "All":
+        lang_lower = lang_filter.lower()
+        narrow({pos for lang, positions in index["langs"].items() if lang_lower in lang for pos in positions})
+    if service_filter != "All":
+        service_lower = service_filter.lower()
+        narrow({pos for service, positions in index["services"].items() if service_lower in service for pos in positions})
+    # Items without hours data have an empty mask and are skipped
+    if day_filter != "All":
+        required_days = day_mask([day_filter])
+        narrow({pos for mask, positions in index["days"].items() if mask & required_days for pos in positions})
+    return None if candidates is None else sorted(candidates)
+
+def rank_items(items: List[Dict], query: str, category: str, zip_filter: str, lang_filter: str, service_filter: str = "All", day_filter: str = "All", index: Dict = None, limit: int = None) -> List[Tuple[int, Dict]]:
+    """Score items against the query, best first; with limit, only the top `limit` are returned."""
+    terms = expand_terms(query, category)
+    # Required services must all be present; each mentioned one adds a bonus
+    require_cols = bit_columns(sum(_SERVICE_PATTERN_BITS[p] for p in must_have_patterns(terms, category)))
+    bonus_cols = bit_columns(service_bits(query))
+
+    # Synonym terms are matched through the precomputed term columns; other query words directly
+    query_bits = 0
+    other_terms = []
+    for t in terms:
+        bit = _TERM_BITS.get(t)
+        if bit:
+            query_bits |= bit
+        else:
+            other_terms.append(t)
+
+    # An index built for another list (e.g. before quick filters) can't be reused
+    if index is None or index["size"] != len(items):
+        index = build_filter_index(items)
+    candidates = filter_candidates(index, zip_filter, lang_filter, service_filter, day_filter)
+    positions = np.arange(len(items)) if candidates is None else np.array(candidates, dtype=np.intp)
+
+    # If user asked for specific service(s), require them in Services
+    if require_cols:
+        positions = positions[index["svc_hits"][positions][:, require_cols].all(axis=1)]
+
+    # Base score + small bonuses
+    if terms:
+        scores = index["term_hits"][:, bit_columns(query_bits)][positions].sum(axis=1)
+        for t in other_terms:
+            scores += blobs_containing(index, t)[positions]
+    else:
+        scores = np.ones(len(positions), dtype=np.intp)
+    scores += 2 * index["svc_hits"][:, bonus_cols][positions].sum(axis=1)
+
+    keep = scores > 0
+    positions, scores = positions[keep], scores[keep]
+    # Only items scoring at least the limit-th best score can make the cut (ties included)
+    if limit is not None and 0 < limit < len(scores):
+        kth = len(scores) - limit
+        keep = scores >= np.partition(scores, kth)[kth]
+        positions, scores = positions[keep], scores[keep]
+    # Best score first, then by name; the stable sort keeps list order among equal names
+    order = np.lexsort((index["names"][positions], -scores))[:limit]
+    return [(int(scores[i]), items[positions[i]]) for i in order]
 
 def is_pinned(cat_key: str, item_id: str) -> bool:
-    return any(p["cat"] == cat_key and p["id"] == item_id for p in st.session_state["pinned"])
+    return (cat_key, item_id) in st.session_state["pinned_keys"]
 
 def toggle_pin(cat_key: str, item: Dict):
     """Toggle pin state for an item. Returns True if pinned, False if unpinned."""
     current_pinned = st.session_state.get("pinned", [])
+    pinned_keys = st.session_state["pinned_keys"]
+    key = (cat_key, item["id"])
     
-    # Check if already pinned
-    existing_index = None
-    for i, p in enumerate(current_pinned):
-        if p["cat"] == cat_key and p["id"] == item["id"]:
-            existing_index = i
-            break
-    
-    if existing_index is not None:
+    if key in pinned_keys:
         # Unpin: remove from list
-        current_pinned.pop(existing_index)
-        st.session_state["pinned"] = current_pinned
+        pinned_keys.discard(key)
+        st.session_state["pinned"] = [p for p in current_pinned if (p["cat"], p["id"]) != key]
         return False
     else:
         # Pin: add to list
@@ -552,6 +791,7 @@ def toggle_pin(cat_key: str, item: Dict):
             "website": item.get("website")
         }
         st.session_state["pinned"] = current_pinned + [pin_data]
+        pinned_keys.add((pin_data["cat"], pin_data["id"]))
         return True
 
 def friendly_intro(category: str, query: str, zip_filter: str, lang_filter: str, service_filter: str = "All", day_filter: str = "All", detected_zip: str = None, detected_service: str = None, detected_day: str = None) -> str:
@@ -586,9 +826,92 @@ def friendly_intro(category: str, query: str, zip_filter: str, lang_filter: str,
     parts.append("Here are a few good fits. Want more? Type **more**. If you'd like, tell me your ZIP, service, day, or language preference and I'll narrow it down.")
     return " ".join(parts)
 
-def render_card(idx: int, item: Dict, cat_key: str):
-    import urllib.parse
+_BADGE_EMOJIS = {
+    "Free": "🟢",
+    "Low Cost": "💰",
+    "Accepts Medicaid": "🔵",
+    "Walk-in": "🚶",
+    "Interpreter Available": "🌐",
+    "24/7 Available": "🕐",
+    "Appointment Required": "📅"
+}
+
+def _card_link(label: str, url: str) -> str:
+    return f'<a class="card-link" href="{html.escape(url)}" target="_blank">{html.escape(label)}</a>'
+
+def card_body_html(item: Dict) -> str:
+    """Static part of a result card as one markdown/HTML string, so each card is a single st.markdown call.
+    It is rendered with unsafe_allow_html, so every value taken from the data is escaped."""
+    md = []
+    
+    # Address with click-to-map
+    if item.get("address"):
+        map_url = f"https://www.google.com/maps/dir/?api=1&destination={urllib.parse.quote(item['address'])}"
+        md.append(f"**📍 Where to find them:**")
+        md.append(_card_link("🗺️ Get Directions", map_url))
+        # <code> rather than a backtick span, which a backtick in the address could close
+        md.append(f"<code>{html.escape(item['address'])}</code>")
+    
+    # Phone with click-to-call
+    if item.get("phone"):
+        # Extract digits from phone number for tel: link
+        phone_text = item.get("phone", "")
+        phone_digits = _NON_DIGIT_RE.sub('', phone_text)  # Remove non-digits
+        if phone_digits and len(phone_digits) >= 10:  # Valid phone number
+            md.append(f"**📞 Give them a call:**")
+            md.append(_card_link(f"📞 Call {phone_text}", f"tel:{phone_digits}"))
+        else:
+            md.append(f"**📞 Give them a call:** {html.escape(phone_text)}")
+    
+    # Website opens in a new tab
+    if item.get("website"):
+        md.append(f"**🌐 Check them out online:**")
+        md.append(_card_link("🌐 Visit Website", item['website']))
     
+    # Display languages - handle both list and string formats
+    if item.get("languages"):
+        langs = item.get("languages", [])
+        if isinstance(langs, list):
+            md.append(f"**🗣 They speak:** {html.escape(', '.join(langs))}")
+        else:
+            md.append(f"**🗣 They speak:** {html.escape(langs)}")
+    
+    # Display services - handle both list and string formats
+    if item.get("services"):
+        services = item.get("services", [])
+        if isinstance(services, list):
+            services_display = ', '.join([s.replace('_', ' ').title() for s in services])
+            md.append(f"**🏥 What they offer:** {html.escape(services_display)}")
+        else:
+            md.append(f"**🏥 What they offer:** {html.escape(services)}")
+    
+    # Display hours - prefer hours_text (from .txt), fallback to structured hours
+    hours_display = item.get("hours_text") or item.get("hours")
+    if hours_display:
+        if isinstance(hours_display, dict):
+            # Format structured hours nicely
+            hours_parts = []
+            for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]:
+                day_key = day.lower()
+                if day_key in hours_display and hours_display[day_key]:
+                    time_ranges = []
+                    for range_group in hours_display[day_key]:
+                        if range_group and len(range_group) == 2:
+                            start = range_group[0]
+                            end = range_group[1]
+                            if len(start) == 2 and len(end) == 2:
+                                start_time = f"{start[0]:02d}:{start[1]:02d}"
+                                end_time = f"{end[0]:02d}:{end[1]:02d}"
+                                time_ranges.append(f"{start_time}-{end_time}")
+                    if time_ranges:
+                        hours_parts.append(f"{day}: {', '.join(time_ranges)}")
+            if hours_parts:
+                md.append(f"**⏰ When they're open:** {'; '.join(hours_parts)}")
+        else:
+            md.append(f"**⏰ When they're open:** {html.escape(hours_display)}")
+    return "\n\n".join(md)
+
+def render_card(idx: int, item: Dict, cat_key: str):
     # Add friendly personality to the clinic display
     emoji = "🏥" if "health" in cat_key.lower() else "🎓" if "education" in cat_key.lower() else "🏠"
     
@@ -596,18 +919,9 @@ def render_card(idx: int, item: Dict, cat_key: str):
     badge_html = ""
     if item.get("availability_badges"):
         badges = item["availability_badges"]
-        badge_emojis = {
-            "Free": "🟢",
-            "Low Cost": "💰",
-            "Accepts Medicaid": "🔵",
-            "Walk-in": "🚶",
-            "Interpreter Available": "🌐",
-            "24/7 Available": "🕐",
-            "Appointment Required": "📅"
-        }
         badge_list = []
         for badge in badges[:3]:  # Show first 3 badges
-            emoji = badge_emojis.get(badge, "✅")
+            emoji = _BADGE_EMOJIS.get(badge, "✅")
             badge_list.append(f"{emoji} {badge}")
         if badge_list:
             badge_html = f"<span style='font-size: 0.9em; color: #666;'>{' • '.join(badge_list)}</span>"
@@ -629,79 +943,16 @@ def render_card(idx: int, item: Dict, cat_key: str):
             st.rerun()
 
     with col2:
-        # Address with click-to-map (using link_button for better mobile support)
-        if item.get("address"):
-            map_url = f"https://www.google.com/maps/dir/?api=1&destination={urllib.parse.quote(item['address'])}"
-            st.markdown(f"**📍 Where to find them:**")
-            st.link_button("🗺️ Get Directions", map_url, use_container_width=True)
-            st.markdown(f"`{item['address']}`")
-        
-        # Phone with click-to-call (using link_button)
-        if item.get("phone"):
-            # Extract digits from phone number for tel: link
-            phone_text = item.get("phone", "")
-            phone_digits = re.sub(r'\D', '', phone_text)  # Remove non-digits
-            if phone_digits and len(phone_digits) >= 10:  # Valid phone number
-                tel_url = f"tel:{phone_digits}"
-                st.markdown(f"**📞 Give them a call:**")
-                st.link_button(f"📞 Call {phone_text}", tel_url, use_container_width=True)
-            else:
-                st.markdown(f"**📞 Give them a call:** {phone_text}")
-        
-        # Website with new tab (using link_button)
-        if item.get("website"):
-            st.markdown(f"**🌐 Check them out online:**")
-            st.link_button("🌐 Visit Website", item['website'], use_container_width=True)
-        
-        # Display languages - handle both list and string formats
-        if item.get("languages"):
-            langs = item.get("languages", [])
-            if isinstance(langs, list):
-                st.markdown(f"**🗣 They speak:** {', '.join(langs)}")
-            else:
-                st.markdown(f"**🗣 They speak:** {langs}")
-        
-        # Display services - handle both list and string formats
-        if item.get("services"):
-            services = item.get("services", [])
-            if isinstance(services, list):
-                services_display = ', '.join([s.replace('_', ' ').title() for s in services])
-                st.markdown(f"**🏥 What they offer:** {services_display}")
-            else:
-                st.markdown(f"**🏥 What they offer:** {services}")
-        
-        # Display hours - prefer hours_text (from .txt), fallback to structured hours
-        hours_display = item.get("hours_text") or item.get("hours")
-        if hours_display:
-            if isinstance(hours_display, dict):
-                # Format structured hours nicely
-                hours_parts = []
-                for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]:
-                    day_key = day.lower()
-                    if day_key in hours_display and hours_display[day_key]:
-                        time_ranges = []
-                        for range_group in hours_display[day_key]:
-                            if range_group and len(range_group) == 2:
-                                start = range_group[0]
-                                end = range_group[1]
-                                if len(start) == 2 and len(end) == 2:
-                                    start_time = f"{start[0]:02d}:{start[1]:02d}"
-                                    end_time = f"{end[0]:02d}:{end[1]:02d}"
-                                    time_ranges.append(f"{start_time}-{end_time}")
-                        if time_ranges:
-                            hours_parts.append(f"{day}: {', '.join(time_ranges)}")
-                if hours_parts:
-                    st.markdown(f"**⏰ When they're open:** {'; '.join(hours_parts)}")
-            else:
-                st.markdown(f"**⏰ When they're open:** {hours_display}")
+        st.markdown(card_body_html(item), unsafe_allow_html=True)
 
 # ===========================
 # Session State
 # ===========================
-st.session_state.setdefault("category", "Healthcare")
-st.session_state.setdefault("datasets_cache", {})
+st.session_state.setdefault("category", CATEGORIES[0])
 st.session_state.setdefault("messages", [])  # [{"role":"user","text":...}, {"role":"assistant","text"/"render":...}]
 st.session_state.setdefault("pinned", [])
+# (cat, id) of every pinned item, so is_pinned is a set lookup; rebuilt from "pinned" each run
+st.session_state["pinned_keys"] = {(p["cat"], p["id"]) for p in st.session_state["pinned"]}
 st.session_state.setdefault("last_query_by_cat", {})
 st.session_state.setdefault("shown_ids_by_cat", {})
 st.session_state.setdefault("scroll_flag", False)
@@ -742,100 +993,111 @@ with st.sidebar:
 # ===========================
 cat_choice = st.radio(
     "Choose a category to search:",
-    ["Healthcare", "Education", "Resettlement / Legal / Shelter"],
+    CATEGORIES,
     horizontal=True,
-    index=["Healthcare", "Education", "Resettlement / Legal / Shelter"].index(st.session_state["category"]),
+    index=CATEGORIES.index(st.session_state["category"]),
     key="category"
 )
 
 # ===========================
 # Load dataset - NOW USING data_loader.py for structured JSON!
 # ===========================
-def get_dataset(cat_key: str) -> Tuple[List[Dict], str]:
+@st.cache_data(ttl=300, show_spinner=False)
+def load_prepared_items(cat_key: str) -> Tuple[List[Dict], Dict, Dict[str, List[str]]]:
+    """data_loader items with the ranking fields precomputed (see prepare_item), plus their
+    filter index and sidebar filter options."""
+    items = [prepare_item(item) for item in data_loader.load_category_data(cat_key)]
+    options = build_filter_options(items, cat_key, data_loader.load_category_meta(cat_key))
+    return items, build_filter_index(items), options
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_parsed_sources(cat_key: str, sources: Tuple[str, ...]) -> Tuple[List[Dict], str, Dict, Dict[str, List[str]]]:
+    """Fallback dataset parsed from the text sources, with its filter index and filter options."""
+    text = fetch_text_from_sources(list(sources))
+    items = parse_blocks(text)
+    return items, text, build_filter_index(items), build_filter_options(items, cat_key)
+
+def get_dataset(cat_key: str) -> List[Dict]:
     """Load dataset using data_loader.py for structured JSON data."""
     # Use data_loader for fast, structured JSON loading
     try:
-        items = data_loader.load_category_data(cat_key)
-        
-        # For backward compatibility, we still need raw_text for filter building
-        # But we can build it from the structured data if needed
-        if cat_key not in st.session_state.get("raw_text_cache", {}):
-            # Build raw text representation from structured data for filter options
-            raw_text_parts = []
-            for item in items[:100]:  # Sample for performance
-                raw_text_parts.append(f"{item.get('name', '')} {item.get('address', '')} {item.get('services_text', '')}")
-            raw_text = "\n".join(raw_text_parts)
-            st.session_state.setdefault("raw_text_cache", {})[cat_key] = raw_text
-        else:
-            raw_text = st.session_state["raw_text_cache"][cat_key]
-        
-        return items, raw_text
+        items, index, options = load_prepared_items(cat_key)
     except Exception as e:
         # Fallback to old parsing if data_loader fails
         st.warning(f"⚠️ Using fallback parsing (data_loader failed: {e})")
-        if cat_key in st.session_state.get("datasets_cache", {}):
-            return st.session_state["datasets_cache"][cat_key]
-        text = fetch_text_from_sources(DATA_SOURCES[cat_key])
-        items = parse_blocks(text)
-        st.session_state.setdefault("datasets_cache", {})[cat_key] = (items, text)
-        return items, text
+        items, _, index, options = load_parsed_sources(cat_key, tuple(DATA_SOURCES[cat_key]))
+    st.session_state.setdefault("filter_index", {})[cat_key] = index
+    st.session_state.setdefault("filter_options", {})[cat_key] = options
+    return items
+
+def zip_and_language_options(items: List[Dict]) -> Tuple[List[str], List[str]]:
+    """ZIP and language filter choices, read from the items' own fields in one pass."""
+    zips = set()
+    langs = set()
+    for item in items:
+        if item.get("_zip"):
+            zips.add(item["_zip"])
+        languages = item.get("languages")
+        # Structured items list their languages; parse_blocks items keep the raw "a, b; c" line
+        if isinstance(languages, str):
+            languages = _LIST_SPLIT_RE.split(languages)
+        for lang in languages or ():
+            lang = lang.strip()
+            if lang and not lang.lower().startswith("and"):
+                langs.add(lang)
+    return sorted(zips), sorted(langs)
+
+def build_filter_options(items: List[Dict], cat_key: str, meta: Dict[str, frozenset] = None) -> Dict[str, List[str]]:
+    """Sidebar choices for a dataset ("All" not included): zips, langs, services and days.
+    
+    `meta` is data_loader.load_category_meta() for structured items; its service set is used as is.
+    Both loaders give every item a "services" field, so only an empty dataset needs the defaults.
+    """
+    zips, langs = zip_and_language_options(items)
+    
+    # Build service filter options based on category
+    # Use structured data if available
+    services = []
+    if meta is not None and items:
+        services.extend(sorted([s.replace("_", " ").title() for s in meta["services"] if s]))
+    elif items:
+        # Extract unique services from parse_blocks items (old format: one string)
+        item_services = (item.get("services") or [] for item in items)
+        all_services = set(chain.from_iterable(s if isinstance(s, list) else [s] for s in item_services))
+        services.extend(sorted([s.replace("_", " ").title() for s in all_services if s]))
+    else:
+        # Fallback to hardcoded options
+        if cat_key == "Healthcare":
+            services.extend(["dental", "pediatric", "mental health", "women's health", "immunization", "primary care"])
+        elif cat_key == "Education":
+            services.extend(["ESL", "GED/Citizenship", "Youth Programs", "Tutoring", "Literacy"])
+        elif cat_key == "Resettlement / Legal / Shelter":
+            services.extend(["Legal Services", "Shelter/Housing", "Benefits Assistance", "Resettlement Services"])
+    
+    # Day of week options from actual hours data, sorted
+    dataset_days = 0
+    for item in items:
+        dataset_days |= item_day_mask(item)
+    days = sorted(day for day, bit in DAY_BITS.items() if dataset_days & bit)
+    
+    return {"zips": zips, "langs": langs, "services": services, "days": days}
+
+@lru_cache(maxsize=8)
+def filter_keys(cat_key: str) -> Dict[str, str]:
+    """Session-state keys of a category's sidebar filters (treat as read-only)."""
+    return {name: f"{name}_{cat_key}" for name in ("zip", "lang", "service", "day")}
 
 try:
-    items, raw_text = get_dataset(st.session_state["category"])
+    items = get_dataset(st.session_state["category"])
 except Exception as e:
     st.error(f"⚠️ Could not load the **{st.session_state['category']}** dataset. Check the GitHub/raw path or local fallback.\n\n{e}")
     st.stop()
 
-# Build filter options from the loaded dataset
-all_zips = sorted(set(re.findall(r"\b60\d{3}\b", raw_text)))
-lang_lines = re.findall(r"🗣\s*Languages:\s*(.+)", raw_text)
-langs = set()
-for line in lang_lines:
-    for lang in re.split(r"[;,]", line):
-        lang = lang.strip()
-        if lang and not lang.lower().startswith("and"):
-            langs.add(lang)
-all_langs = sorted(langs)
-
-# Build service filter options based on category
-# Use structured data if available
-service_options = ["All"]
-if items and isinstance(items, list) and len(items) > 0 and isinstance(items[0], dict) and "services" in items[0]:
-    # Extract unique services from structured data
-    all_services = set()
-    for item in items:
-        services = item.get("services", [])
-        if isinstance(services, list):
-            all_services.update(services)
-        elif services:
-            # Old format: string
-            all_services.add(services)
-    service_options.extend(sorted([s.replace("_", " ").title() for s in all_services if s]))
-else:
-    # Fallback to hardcoded options
-    if cat_choice == "Healthcare":
-        service_options.extend(["dental", "pediatric", "mental health", "women's health", "immunization", "primary care"])
-    elif cat_choice == "Education":
-        service_options.extend(["ESL", "GED/Citizenship", "Youth Programs", "Tutoring", "Literacy"])
-    elif cat_choice == "Resettlement / Legal / Shelter":
-        service_options.extend(["Legal Services", "Shelter/Housing", "Benefits Assistance", "Resettlement Services"])
-
-# Build day of week filter options from actual hours data
-day_options = ["All"]
-available_days = set()
-
-# Extract available days from hours data using smart parsing
-for item in items:
-    # Try hours_text first (from .txt), then structured hours
-    hours = item.get("hours_text") or item.get("hours") or ""
-    if hours:
-        # Use the smart parsing function (handles both dict and string)
-        days_found = parse_day_ranges(hours)
-        for day in days_found:
-            available_days.add(day)
-
-# Add available days to options, sorted
-day_options.extend(sorted(available_days))
+# Filter options are built once per dataset load (see build_filter_options)
+filter_options = st.session_state["filter_options"][st.session_state["category"]]
+all_zips, all_langs = filter_options["zips"], filter_options["langs"]
+service_options = ["All"] + filter_options["services"]
+day_options = ["All"] + filter_options["days"]
 
 # Tip about auto-detection features (now that day_options is defined)
 if len(day_options) > 1:
@@ -844,13 +1106,14 @@ else:
     tip_text = "💡 **Pro tip:** You can include ZIP codes or services in your search (e.g., 'dental 60629', 'ESL programs', 'legal help') and I'll automatically filter!"
 
 with st.sidebar:
-    zip_filter = st.selectbox("Filter by ZIP:", ["All"] + all_zips, key=f"zip_{cat_choice}")
-    lang_filter = st.selectbox("Filter by Language:", ["All"] + all_langs, key=f"lang_{cat_choice}")
-    service_filter = st.selectbox("Filter by Service:", service_options, key=f"service_{cat_choice}")
+    keys = filter_keys(cat_choice)
+    zip_filter = st.selectbox("Filter by ZIP:", ["All"] + all_zips, key=keys["zip"])
+    lang_filter = st.selectbox("Filter by Language:", ["All"] + all_langs, key=keys["lang"])
+    service_filter = st.selectbox("Filter by Service:", service_options, key=keys["service"])
     
     # Only show day filter if there are actual days found in the dataset
     if len(day_options) > 1:  # More than just "All"
-        day_filter = st.selectbox("Filter by Day:", day_options, key=f"day_{cat_choice}")
+        day_filter = st.selectbox("Filter by Day:", day_options, key=keys["day"])
     else:
         day_filter = "All"  # Default to "All" if no days found
     
@@ -869,12 +1132,12 @@ with st.sidebar:
         if st.button("🔁 Reset Chat", key="reset_chat"):
             st.session_state["messages"] = []
             st.session_state["pinned"] = []
+            st.session_state["pinned_keys"] = set()
             st.session_state["shown_ids_by_cat"] = {}
             st.session_state["last_query_by_cat"] = {}
             st.session_state["misspelling_suggestion"] = None
             st.session_state["waiting_for_misspelling_response"] = False
-            # Clear datasets cache to force fresh fetch
-            st.session_state["datasets_cache"] = {}
+            # Datasets are shared by every session, so resetting one chat leaves them cached
             # New API (no deprecation warning)
             try:
                 st.query_params.clear()
@@ -894,7 +1157,7 @@ def respond_to_query(user_text: str, category: str):
     is_more = user_text.strip().lower() == "more"
 
     # 1) Load dataset first (required before using items)
-    items, _ = get_dataset(category)  # get_dataset returns (items, category_str)
+    items = get_dataset(category)
     if not items:
         with st.chat_message("assistant"):
             st.error(f"❌ Could not load {category} data. Please try again.")
@@ -906,7 +1169,7 @@ def respond_to_query(user_text: str, category: str):
     else:
         query = user_text
         if category == "Healthcare":
-            query = re.sub(r"\bclinic(s)?\b", "", query, flags=re.IGNORECASE)
+            query = _CLINIC_RE.sub("", query)
         st.session_state["last_query_by_cat"][category] = query
 
     # 3) Auto-detect ZIP, service, and day from query and apply filtering
@@ -915,26 +1178,23 @@ def respond_to_query(user_text: str, category: str):
     detected_day = None
     
     if not is_more:
-        detected_zip = detect_zip_from_query(query)
-        detected_service = detect_service_from_query(query, category)
-        detected_day = detect_day_from_query(query)
+        detected_zip, detected_service, detected_day = detect_query_filters(query, category)
         
-        # Only use detected day if it's actually available in the dataset
-        if detected_day and not is_day_available_in_dataset(detected_day, items):
+        # Only use detected day if it's actually available in the dataset (see build_filter_options)
+        if detected_day and detected_day not in st.session_state["filter_options"][category]["days"]:
             detected_day = None
         
         if detected_zip or detected_service or detected_day:
             # Clean the query to avoid double-counting
-            query = clean_query_of_service_and_day(query, detected_service, detected_day)
-            if detected_zip:
-                query = clean_query_of_zip(query)
+            query = clean_query_of_detected(query, detected_zip, detected_service, detected_day)
             st.session_state["last_query_by_cat"][category] = query
     
     # 4) Rank with current filters (auto-detected values take priority over sidebar)
-    zf = detected_zip or st.session_state.get(f"zip_{category}", "All") or "All"
-    lf = st.session_state.get(f"lang_{category}", "All") or "All"
-    sf = detected_service or st.session_state.get(f"service_{category}", "All") or "All"
-    df = detected_day or st.session_state.get(f"day_{category}", "All") or "All"
+    ss, keys = st.session_state, filter_keys(category)
+    zf = detected_zip or ss.get(keys["zip"], "All") or "All"
+    lf = ss.get(keys["lang"], "All") or "All"
+    sf = detected_service or ss.get(keys["service"], "All") or "All"
+    df = detected_day or ss.get(keys["day"], "All") or "All"
     
     # Apply quick filters if any are active
     try:
@@ -944,11 +1204,11 @@ def respond_to_query(user_text: str, category: str):
     except:
         pass
     
-    ranked = rank_items(items, query, category, zf, lf, sf, df)
-
-    # 4) Exclude already shown if 'more'
-    shown_map = st.session_state["shown_ids_by_cat"]
-    prev_ids = set(shown_map.get(category, []))
+    index = st.session_state.get("filter_index", {}).get(category)
+    # 4) Exclude already shown if 'more' - at most len(prev_ids) of the top results are skipped
+    # Kept as a set in session state and updated in place below
+    prev_ids = st.session_state["shown_ids_by_cat"].setdefault(category, set())
+    ranked = rank_items(items, query, category, zf, lf, sf, df, index=index, limit=TOP_N + len(prev_ids))
     fresh = [c for _, c in ranked if c["id"] not in prev_ids]
     to_show = fresh[:TOP_N]
 
@@ -993,7 +1253,6 @@ def respond_to_query(user_text: str, category: str):
                 pass
             
             # Map/List view toggle (placed prominently before results)
-            import map_utils
             view_col1, view_col2 = st.columns([1, 4])
             with view_col1:
                 view_mode = st.session_state.get(f"view_mode_{category}", "list")
@@ -1005,6 +1264,9 @@ def respond_to_query(user_text: str, category: str):
             
             # Display results based on view mode
             if view_mode == "map":
+                # Imported here so list-view sessions never load pandas/requests for maps
+                import map_utils
+                
                 # Distance sorting option
                 sort_by_dist = st.checkbox(
                     "📍 Sort by distance (nearest first)", 
@@ -1016,10 +1278,10 @@ def respond_to_query(user_text: str, category: str):
                 user_location = None
                 if zf != "All":
                     # Try to geocode ZIP code center for better distance calculation
+                    # (geocode_address is cached for a day, so reruns don't hit the network)
                     try:
-                        import map_utils as mu
                         zip_address = f"Chicago, IL {zf}"
-                        coords = mu.geocode_address(zip_address)
+                        coords = map_utils.geocode_address(zip_address)
                         if coords:
                             user_location = coords
                     except:
@@ -1032,8 +1294,7 @@ def respond_to_query(user_text: str, category: str):
                     sort_by_dist=sort_by_dist
                 )
             else:
-                ids = [c["id"] for c in to_show]
-                shown_map[category] = list(prev_ids | set(ids))
+                prev_ids.update(c["id"] for c in to_show)
                 for i, c in enumerate(to_show, 1):
                     render_card(i, c, category)
 
@@ -1081,8 +1342,11 @@ def respond_to_query(user_text: str, category: str):
                 return "\n".join(lines[:10])
             
             reply_text = summarize_results(to_show)
-            reply_json = {"category": category, "results": to_show}
-            db.save_assistant_message(
+            # The underscore fields are ranking internals (see prepare_item), not worth storing
+            reply_json = {"category": category, "results": [
+                {k: v for k, v in c.items() if not k.startswith("_")} for c in to_show
+            ]}
+            db.queue_assistant_message(
                 convo_id=st.session_state["convo_id"],
                 reply_text=reply_text,
                 reply_json=reply_json,
@@ -1147,7 +1411,7 @@ def respond_to_query(user_text: str, category: str):
             # Log assistant message to database (no results case)
             reply_text = "No matches in dataset (see national resources above)."
             reply_json = {"category": category, "results": []}
-            db.save_assistant_message(
+            db.queue_assistant_message(
                 convo_id=st.session_state["convo_id"],
                 reply_text=reply_text,
                 reply_json=reply_json,
@@ -1196,7 +1460,7 @@ if prompt:
     st.session_state["messages"].append({"role": "user", "text": prompt})
     
     # Log user message to database
-    db.save_user_message(
+    db.queue_user_message(
         convo_id=st.session_state["convo_id"],
         query_text=prompt,
         category=st.session_state["category"],
@@ -1241,7 +1505,7 @@ if prompt:
             misspelled_word, suggested_correction = misspelling_suggestions[0]  # Take first suggestion
             
             # Create the corrected query
-            corrected_query = prompt.lower().replace(misspelled_word, suggested_correction)
+            corrected_query = correct(prompt)
             
             with st.chat_message("assistant"):
                 st.info(f"🤔 Hey there! I think you might have meant **{suggested_correction}** instead of **{misspelled_word}**?")
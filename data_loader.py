@@ -4,13 +4,32 @@ Data loading and caching module for community resources.
 Handles parsing, normalization, and caching of resource data.
 """
 
+import hashlib
 import json
+import os
+import pickle
 import re
+import sys
+import time
 import functools
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, FrozenSet, Set, Tuple
 import streamlit as st
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # ===========================
 # Constants
 # ===========================
@@ -34,80 +53,310 @@ DATA_SOURCES = {
 # Compile regex patterns once for performance
 ZIP_PATTERN = re.compile(r'\b(60\d{3})\b')
 PHONE_PATTERN = re.compile(r'(\d{3}[-.]?\d{3}[-.]?\d{4})')
+TIME_PATTERN = re.compile(r'(\d{1,2}):?(\d{2})?\s*(am|pm)?')
 EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
 WEBSITE_PATTERN = re.compile(r'https?://[^\s<>"\']+')
+_NON_DIGIT_PATTERN = re.compile(r'\D')
+
+# parse_blocks: block splitting, the "NN. " item prefix and the field labels
+_NUMBERED_SPLIT_PATTERN = re.compile(r'(?:\n\s*\n+|\n)(?=\d+\.\s)')
+_NUMBERED_ITEM_PATTERN = re.compile(r'\n(?=\d+\.\s)')  # matches iff _NUMBERED_SPLIT_PATTERN does
+_BLANK_LINE_SPLIT_PATTERN = re.compile(r'\n\s*\n+')
+_ITEM_PREFIX_PATTERN = re.compile(r'^\d+\.\s*')
+_ITEM_ID_PATTERN = re.compile(r'^(\d+)\.\s')
+_SERVICES_LABEL_PATTERN = re.compile(r'^(services?|🏥|🛟|🛠️):\s*', re.I)
+_PHONE_LABEL_PATTERN = re.compile(r'^(phone|📞):\s*', re.I)
+_HOURS_LABEL_PATTERN = re.compile(r'^(hours?|⏰):\s*', re.I)
+_LANGUAGES_LABEL_PATTERN = re.compile(r'^(languages?|🌐|language):\s*', re.I)
+_WEBSITE_LABEL_PATTERN = re.compile(r'^(website|🌐|web):\s*', re.I)
+_ADDRESS_LABEL_PATTERN = re.compile(r'^(address|📍|location):\s*', re.I)
+_PIN_PREFIX_PATTERN = re.compile(r'^📍\s*')
 
 # Service patterns for normalization with comprehensive subcategories
-SERVICE_PATTERNS = {
-    # Healthcare subcategories
-    "dental": re.compile(r'\b(dental|dentist|oral|teeth|tooth|dental care|exams|cleanings|x.?rays|extractions)\b', re.I),
-    "pediatric": re.compile(r'\b(pediatric|pediatrician|child|children|kids|baby|infant|adolescent|adolescent medicine|youth.?focused)\b', re.I),
-    "mental_health": re.compile(r'\b(mental|therapy|therapist|counseling|counselor|psychology|psychiatric|psychiatry|behavioral health|behavioral)\b', re.I),
-    "primary_care": re.compile(r'\b(primary care|family medicine|family|general|internal medicine|internal|adult|physician|doctor)\b', re.I),
-    "womens_health": re.compile(r'\b(women\'?s health|obstetrics|gynecology|ob/gyn|ob-gyn|ob gyn|prenatal|midwifery|prenatal/ob)\b', re.I),
-    "urgent_care": re.compile(r'\b(urgent|emergency|walk.?in|same.?day|24/7|24 hours)\b', re.I),
-    "hiv_sti": re.compile(r'\b(hiv|sti|std|sexually transmitted|hiv/st?i)\b', re.I),
-    "nutrition": re.compile(r'\b(nutrition|nutritional|dietitian|diet)\b', re.I),
-    "mobile_screening": re.compile(r'\b(mobile|screening|screenings|glucose|blood pressure|immunization|vaccination|vaccine)\b', re.I),
-    "specialty": re.compile(r'\b(surgery|podiatry|surgical|specialty)\b', re.I),
-    
-    # Education subcategories
-    "esl": re.compile(r'\b(esl|english|english language|language training|language classes|english classes|language learning)\b', re.I),
-    "citizenship": re.compile(r'\b(citizenship|citizenship preparation|citizenship classes|citizenship exam|citizenship instruction|civics)\b', re.I),
-    "ged": re.compile(r'\b(ged|high.?school|diploma|adult education|adult basic education)\b', re.I),
-    "literacy": re.compile(r'\b(literacy|literate|reading|adult literacy|basic literacy|family literacy)\b', re.I),
-    "youth_tutoring": re.compile(r'\b(youth|after.?school|tutoring|homework help|after.?school tutoring|mentoring|youth programs)\b', re.I),
-    "computer_literacy": re.compile(r'\b(computer|digital literacy|computer skills|computer classes|digital|technology)\b', re.I),
-    "workforce": re.compile(r'\b(workforce|job training|employment|career|vocational|job readiness|job placement|workforce readiness|workforce development)\b', re.I),
-    "financial_literacy": re.compile(r'\b(financial literacy|financial|money management|budgeting)\b', re.I),
-    
-    # Resettlement/Legal/Shelter subcategories
-    "legal": re.compile(r'\b(legal|lawyer|attorney|immigration|asylum|daca|d?a?c?a|family reunification|court|advocacy|legal services|legal assistance)\b', re.I),
-    "refugee_resettlement": re.compile(r'\b(refugee resettlement|resettlement|case management|welcoming center)\b', re.I),
-    "shelter": re.compile(r'\b(shelter|housing|homeless|emergency housing|emergency shelter|domestic violence shelter|temporary housing)\b', re.I),
-    "employment_assistance": re.compile(r'\b(employment|job|job placement|job readiness|job training|job coaching|career|vocational)\b', re.I),
-    "benefits": re.compile(r'\b(benefits|snap|food stamps|medicaid|cash assistance|public benefits|enrollment|insurance enrollment)\b', re.I),
-    "food": re.compile(r'\b(food|food pantry|pantry|food bank|food distribution|free meals|meals)\b', re.I),
-    "crisis": re.compile(r'\b(crisis|hotline|24.?hour|emergency|abuse|neglect)\b', re.I),
-}
+@st.cache_resource(show_spinner=False)
+def get_service_patterns() -> Dict[str, re.Pattern]:
+    """Service keyword patterns; kept in the resource cache so module reloads reuse them."""
+    return {
+        # Healthcare subcategories
+        "dental": re.compile(r'\b(dental|dentist|oral|teeth|tooth|dental care|exams|cleanings|x.?rays|extractions)\b', re.I),
+        "pediatric": re.compile(r'\b(pediatric|pediatrician|child|children|kids|baby|infant|adolescent|adolescent medicine|youth.?focused)\b', re.I),
+        "mental_health": re.compile(r'\b(mental|therapy|therapist|counseling|counselor|psychology|psychiatric|psychiatry|behavioral health|behavioral)\b', re.I),
+        "primary_care": re.compile(r'\b(primary care|family medicine|family|general|internal medicine|internal|adult|physician|doctor)\b', re.I),
+        "womens_health": re.compile(r'\b(women\'?s health|obstetrics|gynecology|ob/gyn|ob-gyn|ob gyn|prenatal|midwifery|prenatal/ob)\b', re.I),
+        "urgent_care": re.compile(r'\b(urgent|emergency|walk.?in|same.?day|24/7|24 hours)\b', re.I),
+        "hiv_sti": re.compile(r'\b(hiv|sti|std|sexually transmitted|hiv/st?i)\b', re.I),
+        "nutrition": re.compile(r'\b(nutrition|nutritional|dietitian|diet)\b', re.I),
+        "mobile_screening": re.compile(r'\b(mobile|screening|screenings|glucose|blood pressure|immunization|vaccination|vaccine)\b', re.I),
+        "specialty": re.compile(r'\b(surgery|podiatry|surgical|specialty)\b', re.I),
+        
+        # Education subcategories
+        "esl": re.compile(r'\b(esl|english|english language|language training|language classes|english classes|language learning)\b', re.I),
+        "citizenship": re.compile(r'\b(citizenship|citizenship preparation|citizenship classes|citizenship exam|citizenship instruction|civics)\b', re.I),
+        "ged": re.compile(r'\b(ged|high.?school|diploma|adult education|adult basic education)\b', re.I),
+        "literacy": re.compile(r'\b(literacy|literate|reading|adult literacy|basic literacy|family literacy)\b', re.I),
+        "youth_tutoring": re.compile(r'\b(youth|after.?school|tutoring|homework help|after.?school tutoring|mentoring|youth programs)\b', re.I),
+        "computer_literacy": re.compile(r'\b(computer|digital literacy|computer skills|computer classes|digital|technology)\b', re.I),
+        "workforce": re.compile(r'\b(workforce|job training|employment|career|vocational|job readiness|job placement|workforce readiness|workforce development)\b', re.I),
+        "financial_literacy": re.compile(r'\b(financial literacy|financial|money management|budgeting)\b', re.I),
+        
+        # Resettlement/Legal/Shelter subcategories
+        "legal": re.compile(r'\b(legal|lawyer|attorney|immigration|asylum|daca|d?a?c?a|family reunification|court|advocacy|legal services|legal assistance)\b', re.I),
+        "refugee_resettlement": re.compile(r'\b(refugee resettlement|resettlement|case management|welcoming center)\b', re.I),
+        "shelter": re.compile(r'\b(shelter|housing|homeless|emergency housing|emergency shelter|domestic violence shelter|temporary housing)\b', re.I),
+        "employment_assistance": re.compile(r'\b(employment|job|job placement|job readiness|job training|job coaching|career|vocational)\b', re.I),
+        "benefits": re.compile(r'\b(benefits|snap|food stamps|medicaid|cash assistance|public benefits|enrollment|insurance enrollment)\b', re.I),
+        "food": re.compile(r'\b(food|food pantry|pantry|food bank|food distribution|free meals|meals)\b', re.I),
+        "crisis": re.compile(r'\b(crisis|hotline|24.?hour|emergency|abuse|neglect)\b', re.I),
+    }
+
+SERVICE_PATTERNS = get_service_patterns()
 
 # Language patterns for normalization
-LANGUAGE_PATTERNS = {
-    "spanish": re.compile(r'\b(spanish|español|española)\b', re.I),
-    "arabic": re.compile(r'\b(arabic|عربي|arab)\b', re.I),
-    "french": re.compile(r'\b(french|français|française)\b', re.I),
-    "polish": re.compile(r'\b(polish|polski)\b', re.I),
-    "mandarin": re.compile(r'\b(mandarin|chinese|中文|普通话)\b', re.I),
-    "urdu": re.compile(r'\b(urdu|اردو)\b', re.I),
-    "hindi": re.compile(r'\b(hindi|हिन्दी)\b', re.I),
-}
+@st.cache_resource(show_spinner=False)
+def get_language_patterns() -> Dict[str, re.Pattern]:
+    """Language keyword patterns, shared across reruns and module reloads."""
+    return {
+        "spanish": re.compile(r'\b(spanish|español|española)\b', re.I),
+        "arabic": re.compile(r'\b(arabic|عربي|arab)\b', re.I),
+        "french": re.compile(r'\b(french|français|française)\b', re.I),
+        "polish": re.compile(r'\b(polish|polski)\b', re.I),
+        "mandarin": re.compile(r'\b(mandarin|chinese|中文|普通话)\b', re.I),
+        "urdu": re.compile(r'\b(urdu|اردو)\b', re.I),
+        "hindi": re.compile(r'\b(hindi|हिन्दी)\b', re.I),
+    }
+
+LANGUAGE_PATTERNS = get_language_patterns()
 
 # Day patterns for hours parsing
-DAY_PATTERNS = {
-    "monday": re.compile(r'\b(mon|monday)\b', re.I),
-    "tuesday": re.compile(r'\b(tue|tues|tuesday)\b', re.I),
-    "wednesday": re.compile(r'\b(wed|wednesday)\b', re.I),
-    "thursday": re.compile(r'\b(thu|thur|thursday)\b', re.I),
-    "friday": re.compile(r'\b(fri|friday)\b', re.I),
-    "saturday": re.compile(r'\b(sat|saturday)\b', re.I),
-    "sunday": re.compile(r'\b(sun|sunday)\b', re.I),
+@st.cache_resource(show_spinner=False)
+def get_day_patterns() -> Dict[str, re.Pattern]:
+    """Day-name patterns, shared across reruns and module reloads."""
+    return {
+        "monday": re.compile(r'\b(mon|monday)\b', re.I),
+        "tuesday": re.compile(r'\b(tue|tues|tuesday)\b', re.I),
+        "wednesday": re.compile(r'\b(wed|wednesday)\b', re.I),
+        "thursday": re.compile(r'\b(thu|thur|thursday)\b', re.I),
+        "friday": re.compile(r'\b(fri|friday)\b', re.I),
+        "saturday": re.compile(r'\b(sat|saturday)\b', re.I),
+        "sunday": re.compile(r'\b(sun|sunday)\b', re.I),
+    }
+
+DAY_PATTERNS = get_day_patterns()
+
+# parse_hours finds all day names in one pass; each group is named after its DAY_PATTERNS key
+_DAY_SCAN = re.compile(
+    r'\b(?:' + "|".join(f"(?P<{day}>{pattern.pattern[3:-3]})" for day, pattern in DAY_PATTERNS.items()) + r')\b',
+    re.I,
+)
+
+# ===========================
+# Keyword Scanning
+# ===========================
+
+# Services, languages, subcategories and badges are all "\b(kw1|kw2|...)\b" rules.
+# With pyahocorasick, every literal keyword of a rule set goes into one automaton,
+# so a text is scanned once instead of once per label. Without it, single-word
+# keywords ("dentist") are looked up per word of the text in a dict. Whatever is
+# left (phrases like "primary care" in the dict case, "walk.?in" wildcards in
+# both) stays in a small per-label regex, run only for labels not found yet.
+# Either way the labels are the same as searching each rule's regex.
+_WORD_CHAR = re.compile(r'\w')
+_WORD_PATTERN = re.compile(r'\w+')
+_REGEX_SPECIALS = frozenset('.^$*+{}[]|()\\')
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """True if text[start:end] is not part of a longer word."""
+    before = text[start - 1] if start > 0 else " "
+    after = text[end] if end < len(text) else " "
+    return not _WORD_CHAR.match(before) and not _WORD_CHAR.match(after)
+
+def _expand_keyword(keyword: str) -> Optional[List[str]]:
+    """Spell out a keyword's optional characters ("st?i" -> si, sti); None if it is not a plain literal."""
+    variants = [""]
+    i = 0
+    while i < len(keyword):
+        char = keyword[i]
+        if char == "\\" and i + 1 < len(keyword) and not keyword[i + 1].isalnum():
+            i += 1
+            char = keyword[i]
+        elif char in _REGEX_SPECIALS or char == "?":
+            return None
+        i += 1
+        if i < len(keyword) and keyword[i] == "?":
+            i += 1
+            variants = [v + c for v in variants for c in ("", char)]
+        else:
+            variants = [v + char for v in variants]
+    if not all(_WORD_CHAR.match(v[:1]) and _WORD_CHAR.match(v[-1:]) for v in variants):
+        return None  # \b next to a non-word character means something else
+    return variants
+
+def _keyword_scan(rules, flags: int = re.I) -> Dict[str, Any]:
+    """Build the matcher used by _scan_labels from (label, whole-word alternation pattern) rules."""
+    automaton = ahocorasick.Automaton() if HAS_AHOCORASICK else None
+    words: Dict[str, Tuple[str, ...]] = {}
+    leftovers = []
+    for label, source in rules:
+        assert source.startswith(r'\b(') and source.endswith(r')\b'), source
+        leftover = []
+        for keyword in source[3:-3].split("|"):
+            variants = _expand_keyword(keyword)
+            if variants is None or (automaton is None and not all(map(_WORD_PATTERN.fullmatch, variants))):
+                leftover.append(keyword)
+                continue
+            for variant in variants:
+                variant = variant.lower() if flags & re.I else variant
+                # Several labels can share a keyword, so each key maps to all of them
+                if automaton is not None:
+                    labels = automaton.get(variant, (len(variant), ()))[1]
+                    if label not in labels:
+                        automaton.add_word(variant, (len(variant), labels + (label,)))
+                elif label not in words.get(variant, ()):
+                    words[variant] = words.get(variant, ()) + (label,)
+        if leftover:
+            leftovers.append((label, re.compile(r'\b(' + "|".join(leftover) + r')\b', flags).search))
+    if automaton is not None:
+        automaton.make_automaton()
+    return {"automaton": automaton, "words": words, "leftovers": tuple(leftovers)}
+
+def _scan_labels(text: str, scan: Dict[str, Any]) -> Set[str]:
+    """Labels of every rule in scan that matches text (already lowercased)."""
+    found = set()
+    automaton = scan["automaton"]
+    if automaton is not None:
+        for end_idx, (length, labels) in automaton.iter(text):
+            if _is_whole_word(text, end_idx + 1 - length, end_idx + 1):
+                found.update(labels)
+    else:
+        words = scan["words"]
+        for word in _WORD_PATTERN.findall(text):
+            labels = words.get(word)
+            if labels:
+                found.update(labels)
+    found.update(label for label, search in scan["leftovers"] if label not in found and search(text))
+    return found
+
+# normalize_services lowercases its input first, so it scans with case-sensitive copies;
+# IGNORECASE makes Python's re noticeably slower on these alternations
+_SERVICE_SCAN = _keyword_scan(((service_type, pattern.pattern) for service_type, pattern in SERVICE_PATTERNS.items()), flags=0)
+
+_LANGUAGE_SCAN = _keyword_scan((lang_type, pattern.pattern) for lang_type, pattern in LANGUAGE_PATTERNS.items())
+
+# Availability badges (Free, Medicaid, Walk-in, ...)
+_BADGE_SCAN = _keyword_scan((
+    ("Free", r'\b(free|no cost|no-cost|complimentary|pro bono|tuition-free)\b'),
+    ("Low Cost", r'\b(low cost|low-cost|affordable|sliding scale|income-based)\b'),
+    ("Accepts Medicaid", r'\b(medicaid|medicare|insurance|accepts medicaid|medicaid accepted)\b'),
+    ("Walk-in", r'\b(walk.?in|walk in|no appointment|drop.?in|same.?day)\b'),
+    ("Interpreter Available", r'\b(interpreter|translation|bilingual|language services|multilingual)\b'),
+    ("24/7 Available", r'\b(24/7|24 hours|always open|emergency|round.?the.?clock)\b'),
+    ("Appointment Required", r'\b(appointment required|call ahead|schedule|booking)\b'),
+))
+
+# Subcategories shown for each category
+_SUBCATEGORY_SCANS = {
+    "Healthcare": _keyword_scan((
+        ("Primary Care", r'\b(family medicine|primary care|internal medicine|general)\b'),
+        ("Dental", r'\b(dental|dentist|oral)\b'),
+        ("Pediatrics", r'\b(pediatric|children|kids|adolescent|youth)\b'),
+        ("Women's Health", r'\b(women|obstetrics|gynecology|ob/gyn|prenatal|midwifery)\b'),
+        ("Mental Health", r'\b(mental|therapy|counseling|psychiatric|behavioral)\b'),
+        ("Mobile/Screening Services", r'\b(mobile|screening|immunization|vaccination)\b'),
+        ("HIV/STI Services", r'\b(hiv|sti|std)\b'),
+        ("Nutrition", r'\b(nutrition)\b'),
+        ("Urgent Care", r'\b(urgent|emergency|24/7|24 hours)\b'),
+        ("Specialty Care", r'\b(surgery|podiatry|specialty)\b'),
+    )),
+    "Education": _keyword_scan((
+        ("ESL Classes", r'\b(esl|english language|english classes)\b'),
+        ("Citizenship Preparation", r'\b(citizenship|civics)\b'),
+        ("GED Preparation", r'\b(ged|high school|diploma|adult education)\b'),
+        ("Adult Literacy", r'\b(literacy|reading)\b'),
+        ("Youth Tutoring", r'\b(youth|after.?school|tutoring|homework help)\b'),
+        ("Computer Literacy", r'\b(computer|digital|technology)\b'),
+        ("Workforce Development", r'\b(workforce|job training|employment|career|vocational)\b'),
+        ("Financial Literacy", r'\b(financial literacy|financial)\b'),
+    )),
+    "Resettlement / Legal / Shelter": _keyword_scan((
+        ("Refugee Resettlement", r'\b(refugee resettlement|resettlement|case management)\b'),
+        ("Legal Services", r'\b(legal|lawyer|attorney|immigration|asylum|daca)\b'),
+        ("Emergency Shelter/Housing", r'\b(shelter|housing|homeless|emergency housing)\b'),
+        ("Employment Assistance", r'\b(employment|job|job placement|job training)\b'),
+        ("Public Benefits", r'\b(benefits|snap|medicaid|cash assistance|public benefits)\b'),
+        ("Food Assistance", r'\b(food|food pantry|food bank|free meals)\b'),
+        ("Crisis Services", r'\b(domestic violence|abuse|crisis)\b'),
+    )),
 }
 
+# The same services/languages texts recur across records and on every reparse, so
+# these scans are memoized on the lowercased text. Tuples keep cached results from
+# being mutated through a record; sorting gives the labels a stable order.
+@functools.lru_cache(maxsize=4096)
+def _service_labels(services_lower: str) -> Tuple[str, ...]:
+    return tuple(sorted(_scan_labels(services_lower, _SERVICE_SCAN)))
+
+@functools.lru_cache(maxsize=4096)
+def _subcategory_labels(services_lower: str, category: str) -> Tuple[str, ...]:
+    scan = _SUBCATEGORY_SCANS.get(category)
+    return tuple(sorted(_scan_labels(services_lower, scan))) if scan else ()
+
+@functools.lru_cache(maxsize=1024)
+def _language_labels(languages_lower: str) -> Tuple[str, ...]:
+    return tuple(sorted(_scan_labels(languages_lower, _LANGUAGE_SCAN)))
+
 # ===========================
 # Utility Functions
 # ===========================
 
+# After a connection-level failure (DNS, refused, connect timeout) the http sources are
+# skipped for a while, so every category falls back to its local copy straight away
+# instead of each waiting out its own timeout
+HTTP_BACKOFF_SECONDS = 60
+HTTP_TIMEOUT = (3, 10)  # (connect, read) seconds
+_http_down_until = 0.0
+
+@st.cache_resource(show_spinner=False)
+def _http_session():
+    """One keep-alive session shared by all http sources, so refreshes (and the
+    parallel preload) reuse pooled connections instead of a new TLS handshake per GET."""
+    import requests
+    return requests.Session()
+
 def fetch_text_from_sources(sources: List[str]) -> Optional[str]:
     """Try each source in order and return the first non-empty text."""
     import requests
+    global _http_down_until
     
     for source in sources:
         try:
             if source.startswith('http'):
-                response = requests.get(source, timeout=10)
+                if time.monotonic() < _http_down_until:
+                    continue
+                # Conditional GET against the last good response, so an unchanged file is a bodiless 304
+                memo_path = _http_memo_path(source)
+                memo = _read_cache_file(memo_path)
+                headers = {}
+                if memo:
+                    if memo.get("etag"):
+                        headers["If-None-Match"] = memo["etag"]
+                    if memo.get("last_modified"):
+                        headers["If-Modified-Since"] = memo["last_modified"]
+                try:
+                    response = _http_session().get(source, timeout=HTTP_TIMEOUT, headers=headers)
+                except requests.ConnectionError:
+                    _http_down_until = time.monotonic() + HTTP_BACKOFF_SECONDS
+                    raise
+                if response.status_code == 304 and memo and memo.get("text"):
+                    return memo["text"]
                 if response.status_code == 200:
                     text = response.text.strip()
                     if text:
+                        if "ETag" in response.headers or "Last-Modified" in response.headers:
+                            _write_cache_file(memo_path, {
+                                "etag": response.headers.get("ETag"),
+                                "last_modified": response.headers.get("Last-Modified"),
+                                "text": text,
+                            })
                         return text
             else:
                 # Local file
@@ -131,7 +380,7 @@ def normalize_phone(phone_text: str) -> Dict[str, str]:
     if phone_match:
         phone = phone_match.group(1)
         # Normalize to digits only
-        phone_digits = re.sub(r'\D', '', phone)
+        phone_digits = _NON_DIGIT_PATTERN.sub('', phone)
         return {"phone": phone, "phone_digits": phone_digits}
     
     return {"phone": phone_text.strip(), "phone_digits": ""}
@@ -164,133 +413,30 @@ def normalize_services(services_text: str) -> List[str]:
     if not services_text:
         return []
     
-    services = []
-    services_lower = services_text.lower()
-    
     # Check all patterns and collect matching subcategories
-    for service_type, pattern in SERVICE_PATTERNS.items():
-        if pattern.search(services_lower):
-            services.append(service_type)
-    
-    return list(set(services))  # Remove duplicates
+    return list(_service_labels(services_text.lower()))
 
 def get_availability_badges(services_text: str, name: str = "", address: str = "") -> List[str]:
     """Extract availability badges (Free, Medicaid, Walk-in, etc.) from resource description."""
-    badges = []
     if not services_text:
-        return badges
+        return []
     
     text_lower = (services_text + " " + name + " " + address).lower()
-    
-    # Free services
-    if re.search(r'\b(free|no cost|no-cost|complimentary|pro bono|tuition-free)\b', text_lower, re.I):
-        badges.append("Free")
-    
-    # Low cost / Affordable
-    if re.search(r'\b(low cost|low-cost|affordable|sliding scale|income-based)\b', text_lower, re.I):
-        badges.append("Low Cost")
-    
-    # Medicaid acceptance
-    if re.search(r'\b(medicaid|medicare|insurance|accepts medicaid|medicaid accepted)\b', text_lower, re.I):
-        badges.append("Accepts Medicaid")
-    
-    # Walk-in / No appointment
-    if re.search(r'\b(walk.?in|walk in|no appointment|drop.?in|same.?day)\b', text_lower, re.I):
-        badges.append("Walk-in")
-    
-    # Interpreter available
-    if re.search(r'\b(interpreter|translation|bilingual|language services|multilingual)\b', text_lower, re.I):
-        badges.append("Interpreter Available")
-    
-    # 24/7 / Emergency
-    if re.search(r'\b(24/7|24 hours|always open|emergency|round.?the.?clock)\b', text_lower, re.I):
-        badges.append("24/7 Available")
-    
-    # Appointment required
-    if re.search(r'\b(appointment required|call ahead|schedule|booking)\b', text_lower, re.I):
-        badges.append("Appointment Required")
-    
-    return list(set(badges))  # Remove duplicates
+    return list(_scan_labels(text_lower, _BADGE_SCAN))
 
 def get_subcategories(services_text: str, category: str) -> List[str]:
     """Extract subcategories based on category and services description."""
-    if not services_text:
+    if not services_text or category not in _SUBCATEGORY_SCANS:
         return []
     
-    subcategories = []
-    services_lower = services_text.lower()
-    
-    if category == "Healthcare":
-        if re.search(r'\b(family medicine|primary care|internal medicine|general)\b', services_lower, re.I):
-            subcategories.append("Primary Care")
-        if re.search(r'\b(dental|dentist|oral)\b', services_lower, re.I):
-            subcategories.append("Dental")
-        if re.search(r'\b(pediatric|children|kids|adolescent|youth)\b', services_lower, re.I):
-            subcategories.append("Pediatrics")
-        if re.search(r'\b(women|obstetrics|gynecology|ob/gyn|prenatal|midwifery)\b', services_lower, re.I):
-            subcategories.append("Women's Health")
-        if re.search(r'\b(mental|therapy|counseling|psychiatric|behavioral)\b', services_lower, re.I):
-            subcategories.append("Mental Health")
-        if re.search(r'\b(mobile|screening|immunization|vaccination)\b', services_lower, re.I):
-            subcategories.append("Mobile/Screening Services")
-        if re.search(r'\b(hiv|sti|std)\b', services_lower, re.I):
-            subcategories.append("HIV/STI Services")
-        if re.search(r'\b(nutrition)\b', services_lower, re.I):
-            subcategories.append("Nutrition")
-        if re.search(r'\b(urgent|emergency|24/7|24 hours)\b', services_lower, re.I):
-            subcategories.append("Urgent Care")
-        if re.search(r'\b(surgery|podiatry|specialty)\b', services_lower, re.I):
-            subcategories.append("Specialty Care")
-    
-    elif category == "Education":
-        if re.search(r'\b(esl|english language|english classes)\b', services_lower, re.I):
-            subcategories.append("ESL Classes")
-        if re.search(r'\b(citizenship|civics)\b', services_lower, re.I):
-            subcategories.append("Citizenship Preparation")
-        if re.search(r'\b(ged|high school|diploma|adult education)\b', services_lower, re.I):
-            subcategories.append("GED Preparation")
-        if re.search(r'\b(literacy|reading)\b', services_lower, re.I):
-            subcategories.append("Adult Literacy")
-        if re.search(r'\b(youth|after.?school|tutoring|homework help)\b', services_lower, re.I):
-            subcategories.append("Youth Tutoring")
-        if re.search(r'\b(computer|digital|technology)\b', services_lower, re.I):
-            subcategories.append("Computer Literacy")
-        if re.search(r'\b(workforce|job training|employment|career|vocational)\b', services_lower, re.I):
-            subcategories.append("Workforce Development")
-        if re.search(r'\b(financial literacy|financial)\b', services_lower, re.I):
-            subcategories.append("Financial Literacy")
-    
-    elif category == "Resettlement / Legal / Shelter":
-        if re.search(r'\b(refugee resettlement|resettlement|case management)\b', services_lower, re.I):
-            subcategories.append("Refugee Resettlement")
-        if re.search(r'\b(legal|lawyer|attorney|immigration|asylum|daca)\b', services_lower, re.I):
-            subcategories.append("Legal Services")
-        if re.search(r'\b(shelter|housing|homeless|emergency housing)\b', services_lower, re.I):
-            subcategories.append("Emergency Shelter/Housing")
-        if re.search(r'\b(employment|job|job placement|job training)\b', services_lower, re.I):
-            subcategories.append("Employment Assistance")
-        if re.search(r'\b(benefits|snap|medicaid|cash assistance|public benefits)\b', services_lower, re.I):
-            subcategories.append("Public Benefits")
-        if re.search(r'\b(food|food pantry|food bank|free meals)\b', services_lower, re.I):
-            subcategories.append("Food Assistance")
-        if re.search(r'\b(domestic violence|abuse|crisis)\b', services_lower, re.I):
-            subcategories.append("Crisis Services")
-    
-    return list(set(subcategories))  # Remove duplicates
+    return list(_subcategory_labels(services_text.lower(), category))
 
 def normalize_languages(languages_text: str) -> List[str]:
     """Normalize and categorize languages."""
     if not languages_text:
         return []
     
-    languages = []
-    languages_lower = languages_text.lower()
-    
-    for lang_type, pattern in LANGUAGE_PATTERNS.items():
-        if pattern.search(languages_lower):
-            languages.append(lang_type)
-    
-    return list(set(languages))  # Remove duplicates
+    return list(_language_labels(languages_text.lower()))
 
 def parse_hours(hours_text: str) -> Dict[str, List[tuple]]:
     """Parse hours text into structured format."""
@@ -300,35 +446,34 @@ def parse_hours(hours_text: str) -> Dict[str, List[tuple]]:
     hours_dict = {}
     hours_lower = hours_text.lower()
     
-    # Simple time pattern
-    time_pattern = re.compile(r'(\d{1,2}):?(\d{2})?\s*(am|pm)?')
+    # Where each day's first mention ends
+    day_ends = {}
+    for day_match in _DAY_SCAN.finditer(hours_lower):
+        day_ends.setdefault(day_match.lastgroup, day_match.end())
     
-    for day, pattern in DAY_PATTERNS.items():
-        if pattern.search(hours_lower):
+    for day in DAY_PATTERNS:
+        if day in day_ends:
             # Extract time ranges for this day
-            day_text = pattern.search(hours_lower)
-            if day_text:
-                start_pos = day_text.end()
-                # Look for time patterns after the day
-                remaining = hours_lower[start_pos:start_pos+50]  # Look ahead 50 chars
-                times = time_pattern.findall(remaining)
+            start_pos = day_ends[day]
+            # Look for time patterns after the day
+            times = TIME_PATTERN.findall(hours_lower, start_pos, start_pos + 50)  # Look ahead 50 chars
+            
+            if times:
+                # Convert to time objects (simplified)
+                time_ranges = []
+                for i in range(0, len(times), 2):
+                    if i+1 < len(times):
+                        start_time = times[i]
+                        end_time = times[i+1]
+                        # Convert to time tuples (hour, minute)
+                        start_hour = int(start_time[0])
+                        start_min = int(start_time[1]) if start_time[1] else 0
+                        end_hour = int(end_time[0])
+                        end_min = int(end_time[1]) if end_time[1] else 0
+                        
+                        time_ranges.append(((start_hour, start_min), (end_hour, end_min)))
                 
-                if times:
-                    # Convert to time objects (simplified)
-                    time_ranges = []
-                    for i in range(0, len(times), 2):
-                        if i+1 < len(times):
-                            start_time = times[i]
-                            end_time = times[i+1]
-                            # Convert to time tuples (hour, minute)
-                            start_hour = int(start_time[0])
-                            start_min = int(start_time[1]) if start_time[1] else 0
-                            end_hour = int(end_time[0])
-                            end_min = int(end_time[1]) if end_time[1] else 0
-                            
-                            time_ranges.append(((start_hour, start_min), (end_hour, end_min)))
-                    
-                    hours_dict[day] = time_ranges
+                hours_dict[day] = time_ranges
     
     return hours_dict
 
@@ -341,27 +486,25 @@ def parse_blocks(text: str, category: str = "") -> List[Dict[str, Any]]:
     # First, normalize: split by double newlines OR by numbered item patterns
     text_clean = text.strip()
     
-    # Try splitting by numbered items first (more reliable)
-    blocks = re.split(r'(?:\n\s*\n+|\n)(?=\d+\.\s)', text_clean)
-    
-    # If that doesn't work well, fall back to double newlines
-    if len(blocks) < 2:
-        blocks = re.split(r'\n\s*\n+', text_clean)
+    # Split by numbered items when the text has any (more reliable),
+    # otherwise fall back to double newlines; either way the text is split once
+    if _NUMBERED_ITEM_PATTERN.search(text_clean):
+        blocks = _NUMBERED_SPLIT_PATTERN.split(text_clean)
+    else:
+        blocks = _BLANK_LINE_SPLIT_PATTERN.split(text_clean)
     
     for block in blocks:
-        if not block.strip():
-            continue
-            
-        lines = [line.strip() for line in block.split('\n') if line.strip()]
+        # Lines are stripped once here; everything below works on the stripped lines
+        lines = [stripped for line in block.split('\n') if (stripped := line.strip())]
         if len(lines) < 2:
             continue
         
         # Extract name (usually first line, may have "NN. " prefix)
-        first_line = lines[0].strip()
-        name = re.sub(r'^\d+\.\s*', '', first_line).strip()
+        first_line = lines[0]
+        name = _ITEM_PREFIX_PATTERN.sub('', first_line).strip()
         
         # Try to extract item ID from first line if present
-        id_match = re.match(r'^(\d+)\.\s', first_line)
+        id_match = _ITEM_ID_PATTERN.match(first_line)
         item_id = id_match.group(1) if id_match else f"item_{len(items) + 1}"
         
         # Initialize record
@@ -383,94 +526,209 @@ def parse_blocks(text: str, category: str = "") -> List[Dict[str, Any]]:
             "search_blob": "",  # Precomputed for fast search
         }
         
-        # Parse other fields
+        # Parse other fields; the field is picked by plain substring tests in
+        # priority order, which is several times cheaper than any() over a list
+        # or one combined regex
         for line in lines[1:]:
             line_lower = line.lower()
             
-            if any(keyword in line_lower for keyword in ['services:', '🏥', '🛟', '🛠️']):
-                services_text = re.sub(r'^(services?|🏥|🛟|🛠️):\s*', '', line, flags=re.I).strip()
+            if 'services:' in line_lower or '🏥' in line_lower or '🛟' in line_lower or '🛠️' in line_lower:
+                services_text = _SERVICES_LABEL_PATTERN.sub('', line).strip()
                 record["services_text"] = services_text
-                record["services"] = normalize_services(services_text)
+                # Lowercased once for the service, subcategory and badge scans
+                # (same results as normalize_services / get_subcategories / get_availability_badges)
+                services_lower = services_text.lower()
+                record["services"] = list(_service_labels(services_lower))
                 # Extract subcategories based on category
                 if category:
-                    record["subcategories"] = get_subcategories(services_text, category)
+                    record["subcategories"] = list(_subcategory_labels(services_lower, category))
                 # Extract availability badges
-                record["availability_badges"] = get_availability_badges(services_text, record["name"], record["address"])
+                if services_text:
+                    badge_text = " ".join((services_lower, record["name"].lower(), record["address"].lower()))
+                    record["availability_badges"] = list(_scan_labels(badge_text, _BADGE_SCAN))
+                else:
+                    record["availability_badges"] = []
             
-            elif any(keyword in line_lower for keyword in ['phone:', '📞']):
-                phone_text = re.sub(r'^(phone|📞):\s*', '', line, flags=re.I).strip()
+            elif 'phone:' in line_lower or '📞' in line_lower:
+                phone_text = _PHONE_LABEL_PATTERN.sub('', line).strip()
                 phone_data = normalize_phone(phone_text)
                 record["phone"] = phone_data["phone"]
                 record["phone_digits"] = phone_data["phone_digits"]
             
-            elif any(keyword in line_lower for keyword in ['hours:', '⏰']):
-                hours_text = re.sub(r'^(hours?|⏰):\s*', '', line, flags=re.I).strip()
+            elif 'hours:' in line_lower or '⏰' in line_lower:
+                hours_text = _HOURS_LABEL_PATTERN.sub('', line).strip()
                 record["hours"] = parse_hours(hours_text)
                 record["hours_text"] = hours_text
             
-            elif any(keyword in line_lower for keyword in ['languages:', '🌐', 'language:']):
-                lang_text = re.sub(r'^(languages?|🌐|language):\s*', '', line, flags=re.I).strip()
+            elif 'languages:' in line_lower or '🌐' in line_lower or 'language:' in line_lower:
+                lang_text = _LANGUAGES_LABEL_PATTERN.sub('', line).strip()
                 record["languages"] = normalize_languages(lang_text)
             
-            elif any(keyword in line_lower for keyword in ['website:', '🌐', 'web:']):
-                web_text = re.sub(r'^(website|🌐|web):\s*', '', line, flags=re.I).strip()
+            elif 'website:' in line_lower or '🌐' in line_lower or 'web:' in line_lower:
+                web_text = _WEBSITE_LABEL_PATTERN.sub('', line).strip()
                 record["website"] = normalize_website(web_text)
             
-            elif any(keyword in line_lower for keyword in ['address:', '📍', 'location:']):
+            elif 'address:' in line_lower or '📍' in line_lower or 'location:' in line_lower:
                 # Handle address with or without emoji
-                addr_text = re.sub(r'^(address|📍|location):\s*', '', line, flags=re.I).strip()
+                addr_text = _ADDRESS_LABEL_PATTERN.sub('', line).strip()
                 # Also check if line starts with 📍 without colon
-                if not addr_text and line.strip().startswith('📍'):
-                    addr_text = re.sub(r'^📍\s*', '', line).strip()
+                if not addr_text and line.startswith('📍'):
+                    addr_text = _PIN_PREFIX_PATTERN.sub('', line).strip()
                 record["address"] = addr_text
                 record["zip_code"] = normalize_zip(addr_text)
             
             else:
                 # Check if line starts with 📍 emoji (address indicator)
-                if line.strip().startswith('📍'):
-                    addr_text = re.sub(r'^📍\s*', '', line).strip()
+                if line.startswith('📍'):
+                    addr_text = _PIN_PREFIX_PATTERN.sub('', line).strip()
                     record["address"] = addr_text
                     record["zip_code"] = normalize_zip(addr_text)
                 # Assume it's address if no keyword found and looks like an address
-                elif not record["address"] and len(line) > 10 and ('chicago' in line_lower or 'il' in line_lower or re.search(r'\b(60\d{3})\b', line)):
-                    record["address"] = line
-                    record["zip_code"] = normalize_zip(line)
+                # (one ZIP scan serves both the check and the zip_code)
+                elif not record["address"] and len(line) > 10:
+                    zip_match = ZIP_PATTERN.search(line)
+                    if 'chicago' in line_lower or 'il' in line_lower or zip_match:
+                        record["address"] = line
+                        record["zip_code"] = zip_match.group(1) if zip_match else ""
         
         # Precompute search blob for fast searching (include subcategories and services text)
-        search_fields = [
+        # in one join: the label lists are unpacked into it and empty fields are skipped
+        record["search_blob"] = " ".join(filter(None, (
             record["name"],
             record["address"],
             record["services_text"],  # Include full services text for better semantic matching
-            " ".join(record["services"]),
-            " ".join(record["subcategories"]),  # Include subcategories
-            " ".join(record["languages"]),
-            record["hours_text"]
-        ]
-        record["search_blob"] = " ".join([f for f in search_fields if f]).lower()
+            *record["services"],
+            *record["subcategories"],  # Include subcategories
+            *record["languages"],
+            record["hours_text"],
+        ))).lower()
         
         items.append(record)
     
     return items
 
+# ===========================
+# Disk Cache
+# ===========================
+
+# Parsed items survive process restarts here, so a cold start with unchanged sources
+# unpickles instead of re-running parse_blocks; the last response of each source URL
+# is kept alongside for conditional GETs
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "refugee-resources"
+
+def _parsed_cache_path(raw_text: str, category: str) -> Path:
+    """Cache file for parse_blocks(raw_text, category); keyed by this module's mtime too, so parser edits invalidate it."""
+    key = hashlib.blake2b(digest_size=16)
+    key.update(f"{category}:{os.stat(__file__).st_mtime_ns}:".encode())
+    key.update(raw_text.encode("utf-8"))
+    return CACHE_DIR / f"{key.hexdigest()}.pkl"
+
+def _http_memo_path(url: str) -> Path:
+    """Cache file holding the ETag/Last-Modified validators and text of url's last 200 response."""
+    return CACHE_DIR / f"http-{hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()}.pkl"
+
+def _read_cache_file(path: Path) -> Any:
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+def _write_cache_file(path: Path, value: Any) -> None:
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so a concurrent reader never sees a partial file
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Error saving cache file {path.name}: {e}")
+
+def _read_items_json(path: Path) -> List[Dict[str, Any]]:
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_items_json(path: Path, items: List[Dict[str, Any]]) -> None:
+    """Write items as indented JSON; orjson's OPT_INDENT_2 output is byte-identical to json.dump(indent=2)."""
+    if HAS_ORJSON:
+        try:
+            path.write_bytes(orjson.dumps(items, option=orjson.OPT_INDENT_2))
+            return
+        except TypeError:
+            pass
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(items, f, ensure_ascii=False, indent=2)
+
+def intern_canonical_values(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Intern the canonical labels (services, subcategories, badges, languages, hours days, ZIP)
+    so every item shares one string per label, however the items were loaded.
+    Repeated hours/services texts are shared within the list too (not interned; they are free text)."""
+    shared_texts: Dict[str, str] = {}
+    for item in items:
+        for field in ("hours_text", "services_text"):
+            value = item.get(field)
+            if isinstance(value, str):
+                item[field] = shared_texts.setdefault(value, value)
+        for field in ("services", "subcategories", "availability_badges", "languages"):
+            values = item.get(field)
+            if isinstance(values, list):
+                item[field] = [sys.intern(v) if isinstance(v, str) else v for v in values]
+        hours = item.get("hours")
+        if isinstance(hours, dict):
+            item["hours"] = {sys.intern(day): ranges for day, ranges in hours.items()}
+        if isinstance(item.get("zip_code"), str):
+            item["zip_code"] = sys.intern(item["zip_code"])
+    return items
+
 # ===========================
 # Cached Data Loading
 # ===========================
 
+def _category_json_path(category: str) -> Path:
+    """Normalized JSON copy of a category's items under data/."""
+    category_key = category.lower().replace(" / ", "_").replace(" ", "_")
+    return Path("data") / f"{category_key}.json"
+
+@st.cache_data(max_entries=8, show_spinner=False)  # Keyed on the text itself, so no TTL is needed
+def parse_category_text(raw_text: str, category: str, force_refresh: bool = False) -> List[Dict[str, Any]]:
+    """
+    Parse and normalize a category's .txt source and update its JSON copy.
+    Runs again only when the fetched text changes (or after a clear()).
+    """
+    # Unless this exact text was parsed before (possibly by an earlier process)
+    cache_path = _parsed_cache_path(raw_text, category)
+    items = None if force_refresh else _read_cache_file(cache_path)
+    if items is None:
+        items = parse_blocks(raw_text, category)
+        _write_cache_file(cache_path, items)
+    intern_canonical_values(items)
+    
+    # Save/update JSON from fresh .txt data (GitHub is source of truth)
+    json_path = _category_json_path(category)
+    try:
+        _write_items_json(json_path, items)
+        print(f"✅ Updated {json_path} from GitHub .txt file ({len(items)} items)")
+    except Exception as e:
+        print(f"Error saving normalized JSON: {e}")
+    
+    return items
+
 @st.cache_data(ttl=300, show_spinner=False)  # Cache for 5 minutes - always check GitHub for updates
 def load_category_data(category: str, force_refresh: bool = False) -> List[Dict[str, Any]]:
     """
     Load and cache category data with normalization.
-    Always fetches from GitHub .txt files as source of truth.
+    Always fetches from GitHub .txt files as source of truth; an unchanged file
+    is not parsed again (see parse_category_text).
     
     Args:
         category: Category name
         force_refresh: If True, force refresh from GitHub even if JSON exists
     """
-    data_dir = Path("data")
-    data_dir.mkdir(exist_ok=True)
-    
-    category_key = category.lower().replace(" / ", "_").replace(" ", "_")
-    json_path = data_dir / f"{category_key}.json"
+    Path("data").mkdir(exist_ok=True)
+    json_path = _category_json_path(category)
     
     # Always fetch from GitHub first (source of truth)
     sources = DATA_SOURCES.get(category, [])
@@ -493,24 +751,28 @@ def load_category_data(category: str, force_refresh: bool = False) -> List[Dict[
         # If GitHub fetch fails, try to load from existing JSON
         if json_path.exists() and not force_refresh:
             try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return intern_canonical_values(_read_items_json(json_path))
             except Exception as e:
                 print(f"Error loading cached JSON: {e}")
         return []
     
-    # Parse and normalize from .txt file (source of truth)
-    items = parse_blocks(raw_text, category)
-    
-    # Always save/update JSON from fresh .txt data (GitHub is source of truth)
-    try:
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(items, f, ensure_ascii=False, indent=2)
-        print(f"✅ Updated {json_path} from GitHub .txt file ({len(items)} items)")
-    except Exception as e:
-        print(f"Error saving normalized JSON: {e}")
-    
-    return items
+    if force_refresh:
+        parse_category_text.clear()
+    return parse_category_text(raw_text, category, force_refresh)
+
+def category_meta(items: List[Dict[str, Any]]) -> Dict[str, FrozenSet[str]]:
+    """Distinct services, languages, ZIPs and hours days across a category's items."""
+    return {
+        "services": frozenset(chain.from_iterable(item.get("services", ()) for item in items)),
+        "langs": frozenset(chain.from_iterable(item.get("languages", ()) for item in items)),
+        "zips": frozenset(item["zip_code"] for item in items if item.get("zip_code")),
+        "days": frozenset(chain.from_iterable(item.get("hours", ()) for item in items)),
+    }
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_category_meta(category: str) -> Dict[str, FrozenSet[str]]:
+    """Cached category_meta() of load_category_data(category), so filter options skip the item scan."""
+    return category_meta(load_category_data(category))
 
 @st.cache_resource
 def get_compiled_patterns():
@@ -529,28 +791,32 @@ def get_compiled_patterns():
 # Public API
 # ===========================
 
-def get_dataset(category: str) -> tuple[List[Dict[str, Any]], str]:
-    """Get dataset for a category. Returns (items, raw_text)."""
-    
-    # Load normalized data
-    items = load_category_data(category)
-    
-    # Get raw text for display purposes
-    sources = DATA_SOURCES.get(category, [])
-    raw_text = fetch_text_from_sources(sources) or ""
-    
-    return items, raw_text
+def get_dataset(category: str) -> tuple[List[Dict[str, Any]], Dict[str, FrozenSet[str]]]:
+    """Get dataset for a category. Returns (items, meta), meta as in category_meta()."""
+    return load_category_data(category), load_category_meta(category)
+
+def preload_categories(categories: Iterable[str]) -> None:
+    """Warm load_category_data for several categories at once.
+    Cold loads are mostly waiting on HTTP, so this takes about as long as the slowest one.
+    Errors are not raised here; they come up again when the caller loads that category."""
+    categories = list(categories)
+    if not categories:
+        return
+    with ThreadPoolExecutor(max_workers=min(4, len(categories))) as pool:
+        for future in [pool.submit(load_category_data, category) for category in categories]:
+            future.exception()
 
 def refresh_category_cache(category: str) -> None:
     """Force refresh of category cache."""
-    category_key = category.lower().replace(" / ", "_").replace(" ", "_")
-    json_path = Path("data") / f"{category_key}.json"
+    json_path = _category_json_path(category)
     
     if json_path.exists():
         json_path.unlink()
     
     # Clear Streamlit cache
     load_category_data.clear()
+    load_category_meta.clear()
+    parse_category_text.clear()
     
     # Reload data
     load_category_data(category)
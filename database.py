@@ -1,15 +1,32 @@
 import os
 import json
 import logging
-from typing import Optional, Dict, Any
+import queue
+import threading
+from typing import Optional, Dict, Any, List, Tuple, Union
 import psycopg
 from psycopg.rows import dict_row
 import streamlit as st
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def dumps_json(value: Any) -> str:
+    """Encode a JSONB payload, with orjson when installed (stdlib json for anything orjson rejects)."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(value)
+
 class NeonDatabase:
     def __init__(self):
         self.connection = None
@@ -136,8 +153,8 @@ class NeonDatabase:
             logger.error(f"Failed to save user message: {e}")
             return False
     
-    def save_assistant_message(self, convo_id: str, reply_text: str, reply_json: Dict[str, Any], category: str):
-        """Save assistant message to database"""
+    def save_assistant_message(self, convo_id: str, reply_text: str, reply_json: Union[Dict[str, Any], str], category: str):
+        """Save assistant message to database (reply_json may already be JSON-encoded)"""
         try:
             conn = self.get_connection()
             if not conn:
@@ -155,7 +172,7 @@ class NeonDatabase:
                 cur.execute("""
                     INSERT INTO assistant_messages (convo_id, reply_text, reply_json, category)
                     VALUES (%s, %s, %s, %s)
-                """, (convo_id, reply_text, json.dumps(reply_json), category))
+                """, (convo_id, reply_text, reply_json if isinstance(reply_json, str) else dumps_json(reply_json), category))
                 
                 conn.commit()
                 logger.info(f"Saved assistant message for conversation {convo_id}")
@@ -165,6 +182,47 @@ class NeonDatabase:
             logger.error(f"Failed to save assistant message: {e}")
             return False
     
+    def save_message_batch(self, writes: List[Tuple[str, tuple]]) -> bool:
+        """Save queued (method, args) messages in one transaction, in order"""
+        conn = None
+        try:
+            conn = self.get_connection()
+            if not conn:
+                return False
+                
+            with conn.cursor() as cur:
+                # Ensure conversations exist
+                cur.executemany("""
+                    INSERT INTO conversations (convo_id) 
+                    VALUES (%s) 
+                    ON CONFLICT (convo_id) DO NOTHING
+                """, [(convo_id,) for convo_id in dict.fromkeys(args[0] for _, args in writes)])
+                
+                # clock_timestamp(), unlike the CURRENT_TIMESTAMP default, still
+                # differs between rows of one transaction, so history keeps its order
+                for method, args in writes:
+                    if method == "save_user_message":
+                        cur.execute("""
+                            INSERT INTO user_messages (convo_id, query_text, category, user_label, created_at)
+                            VALUES (%s, %s, %s, %s, clock_timestamp())
+                        """, args)
+                    else:
+                        convo_id, reply_text, reply_json, category = args
+                        cur.execute("""
+                            INSERT INTO assistant_messages (convo_id, reply_text, reply_json, category, created_at)
+                            VALUES (%s, %s, %s, %s, clock_timestamp())
+                        """, (convo_id, reply_text, reply_json if isinstance(reply_json, str) else dumps_json(reply_json), category))
+                
+                conn.commit()
+                logger.info(f"Saved {len(writes)} queued messages")
+                return True
+                
+        except Exception as e:
+            logger.error(f"Failed to save message batch: {e}")
+            if conn and not conn.closed:
+                conn.rollback()
+            return False
+    
     def get_conversation_history(self, convo_id: str) -> list:
         """Get conversation history for a given conversation ID"""
         try:
@@ -227,6 +285,62 @@ def save_assistant_message(convo_id: str, reply_text: str, reply_json: Dict[str,
     """Save an assistant message"""
     return get_db_instance().save_assistant_message(convo_id, reply_text, reply_json, category)
 
+# Background writes: callers enqueue and return immediately, one daemon thread
+# performs the inserts in order so a slow or unreachable database never blocks a render.
+_write_queue: "queue.Queue[tuple]" = queue.Queue(maxsize=1000)
+_writer_thread = None
+_writer_lock = threading.Lock()
+
+# Saves queued while the writer was busy are committed together, up to this many at once
+WRITE_BATCH_SIZE = 50
+
+def _drain_writes():
+    """Writer thread loop: wait for a save, then commit it with whatever else is queued, in arrival order."""
+    # The writer gets its own connection, opened on this thread. psycopg runs one transaction
+    # per connection, so sharing the script thread's would let a rerun's commit or rollback
+    # (initialize_database runs on every rerun) land in the middle of a queued write.
+    writer_db = NeonDatabase()
+    while True:
+        batch = [_write_queue.get()]
+        while len(batch) < WRITE_BATCH_SIZE:
+            try:
+                batch.append(_write_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            if len(batch) == 1 or not writer_db.save_message_batch(batch):
+                # Single save, or a failed batch: write one at a time so one bad message can't drop the rest
+                for method, args in batch:
+                    getattr(writer_db, method)(*args)
+        except Exception as e:
+            logger.error(f"Background write of {len(batch)} messages failed: {e}")
+        finally:
+            for _ in batch:
+                _write_queue.task_done()
+
+def _enqueue_write(method: str, args: tuple):
+    """Queue a save for the writer thread, starting it on first use."""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_drain_writes, name="db-writer", daemon=True)
+            _writer_thread.start()
+    try:
+        _write_queue.put_nowait((method, args))
+    except queue.Full:
+        # Writer is far behind; write inline rather than drop the message
+        logger.warning("Database write queue full, saving synchronously")
+        getattr(get_db_instance(), method)(*args)
+
+def queue_user_message(convo_id: str, query_text: str, category: str, user_label: Optional[str] = None):
+    """Save a user message in the background"""
+    _enqueue_write("save_user_message", (convo_id, query_text, category, user_label))
+
+def queue_assistant_message(convo_id: str, reply_text: str, reply_json: Dict[str, Any], category: str):
+    """Save an assistant message in the background"""
+    # Encode now: the result dicts stay live in session state while the write is pending
+    _enqueue_write("save_assistant_message", (convo_id, reply_text, dumps_json(reply_json), category))
+
 def get_conversation_history(convo_id: str) -> list:
     """Get conversation history"""
     return get_db_instance().get_conversation_history(convo_id)
@@ -4,6 +4,7 @@ Map and geocoding utilities for resource visualization.
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Any, Optional, Tuple
 import requests
@@ -17,7 +18,14 @@ CHICAGO_CENTER = (41.8781, -87.6298)
 # Geocoding
 # ===========================
 
-@st.cache_data(ttl=86400)  # Cache for 24 hours
+@st.cache_resource(show_spinner=False)
+def _geocoder_session() -> requests.Session:
+    """One keep-alive session for all Nominatim requests."""
+    session = requests.Session()
+    session.headers["User-Agent"] = "CommunityResourcesApp/1.0"  # Required by Nominatim
+    return session
+
+@st.cache_data(ttl=86400, show_spinner=False)  # Cache for 24 hours
 def geocode_address(address: str) -> Optional[Tuple[float, float]]:
     """
     Geocode an address to lat/lon using Nominatim (free, no API key needed).
@@ -35,11 +43,7 @@ def geocode_address(address: str) -> Optional[Tuple[float, float]]:
             "limit": 1,
             "addressdetails": 1
         }
-        headers = {
-            "User-Agent": "CommunityResourcesApp/1.0"  # Required by Nominatim
-        }
-        
-        response = requests.get(url, params=params, headers=headers, timeout=5)
+        response = _geocoder_session().get(url, params=params, timeout=5)
         
         if response.status_code == 200:
             data = response.json()
@@ -158,33 +162,19 @@ def render_map_view(items: List[Dict[str, Any]], category: str = "", user_locati
         items_with_coords = sort_by_distance(items_with_coords, user_location)
         st.info("📍 Results sorted by distance (nearest first)")
     
-    # Prepare data for map
-    map_data = []
-    for item in items_with_coords:
-        lat = item.get("latitude")
-        lon = item.get("longitude")
-        
-        if lat and lon:
-            # Create map marker data
-            marker_data = {
-                "name": item.get("name", "Unknown"),
-                "address": item.get("address", ""),
-                "phone": item.get("phone", ""),
-                "lat": lat,
-                "lon": lon,
-            }
-            map_data.append(marker_data)
-    
-    if not map_data:
+    # Prepare data for map: st.map only reads the coordinates, so build one
+    # contiguous (n, 2) float array instead of a DataFrame from per-marker dicts
+    coords = np.array(
+        [(item["latitude"], item["longitude"]) for item in items_with_coords
+         if item.get("latitude") and item.get("longitude")],
+        dtype=float
+    )
+    
+    if not len(coords):
         st.warning("Could not geocode addresses for map display.")
         return
     
-    # Convert to DataFrame for st.map()
-    df = pd.DataFrame(map_data)
-    
-    # Calculate map center (average of all coordinates)
-    center_lat = df["lat"].mean()
-    center_lon = df["lon"].mean()
+    df = pd.DataFrame(coords, columns=["lat", "lon"])
     
     # Display map with markers
     st.map(
@@ -4,112 +4,191 @@ Chicago neighborhood to ZIP code mapping.
 Allows users to search by neighborhood name instead of just ZIP codes.
 """
 
-from typing import List, Tuple
+import re
+import string
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+from rapidfuzz import fuzz, process
 
-NEIGHBORHOOD_TO_ZIPS = {
+_RAW_NEIGHBORHOOD_TO_ZIPS: Dict[str, Tuple[str, ...]] = {
     # North Side
-    "rogers park": ["60626", "60645"],
-    "uptown": ["60613", "60640", "60657"],
-    "lincoln square": ["60625", "60640"],
-    "lakeview": ["60613", "60614", "60657"],
-    "lincoln park": ["60614", "60657"],
-    "old town": ["60610", "60614"],
-    "gold coast": ["60610", "60611"],
-    "river north": ["60610", "60611", "60654"],
-    "loop": ["60601", "60602", "60603", "60604"],
-    "south loop": ["60605", "60616"],
+    "rogers park": ("60626", "60645"),
+    "uptown": ("60613", "60640", "60657"),
+    "lincoln square": ("60625", "60640"),
+    "lakeview": ("60613", "60614", "60657"),
+    "lincoln park": ("60614", "60657"),
+    "old town": ("60610", "60614"),
+    "gold coast": ("60610", "60611"),
+    "river north": ("60610", "60611", "60654"),
+    "loop": ("60601", "60602", "60603", "60604"),
+    "south loop": ("60605", "60616"),
     
     # West Side
-    "humboldt park": ["60622", "60647"],
-    "west town": ["60622", "60647"],
-    "wicker park": ["60622"],
-    "bucktown": ["60622"],
-    "ukrainian village": ["60622"],
-    "logan square": ["60647"],
-    "avondale": ["60618", "60641"],
-    "irving park": ["60618", "60641"],
-    "portage park": ["60630", "60634", "60641"],
-    "austin": ["60644", "60651"],
-    "garfield park": ["60624", "60644"],
-    "lawndale": ["60623", "60624"],
-    "little village": ["60623", "60608"],
-    "pilsen": ["60608", "60616"],
+    "humboldt park": ("60622", "60647"),
+    "west town": ("60622", "60647"),
+    "wicker park": ("60622",),
+    "bucktown": ("60622",),
+    "ukrainian village": ("60622",),
+    "logan square": ("60647",),
+    "avondale": ("60618", "60641"),
+    "irving park": ("60618", "60641"),
+    "portage park": ("60630", "60634", "60641"),
+    "austin": ("60644", "60651"),
+    "garfield park": ("60624", "60644"),
+    "lawndale": ("60623", "60624"),
+    "little village": ("60623", "60608"),
+    "pilsen": ("60608", "60616"),
     
     # South Side
-    "bridgeport": ["60608", "60616"],
-    "chinatown": ["60616"],
-    "bronzeville": ["60615", "60653"],
-    "hyde park": ["60615", "60637"],
-    "kenwood": ["60615", "60637"],
-    "woodlawn": ["60615", "60637"],
-    "englewood": ["60621", "60636"],
-    "auburn gresham": ["60620", "60628"],
-    "chatham": ["60619", "60620"],
-    "south shore": ["60649"],
-    "calumet heights": ["60617", "60619"],
-    "pullman": ["60628"],
-    "roseland": ["60628"],
-    "west pullman": ["60628", "60643"],
-    "morgan park": ["60643"],
-    "beverly": ["60643"],
-    "ashburn": ["60652"],
-    "archer heights": ["60632", "60638"],
-    "brighton park": ["60632", "60629"],
-    "mckinley park": ["60609", "60632"],
-    "back of the yards": ["60609", "60632"],
-    "new city": ["60609", "60632"],
-    "gage park": ["60629", "60632"],
-    "west lawn": ["60629"],
-    "garfield ridge": ["60638"],
-    "clearing": ["60638"],
-    "west elsd": ["60638"],
-    
-    # Common variations
-    "rogers park": ["60626", "60645"],
-    "lincoln square": ["60625", "60640"],
-    "wicker park": ["60622"],
-    "logan square": ["60647"],
-    "little village": ["60623", "60608"],
-    "hyde park": ["60615", "60637"],
+    "bridgeport": ("60608", "60616"),
+    "chinatown": ("60616",),
+    "bronzeville": ("60615", "60653"),
+    "hyde park": ("60615", "60637"),
+    "kenwood": ("60615", "60637"),
+    "woodlawn": ("60615", "60637"),
+    "englewood": ("60621", "60636"),
+    "auburn gresham": ("60620", "60628"),
+    "chatham": ("60619", "60620"),
+    "south shore": ("60649",),
+    "calumet heights": ("60617", "60619"),
+    "pullman": ("60628",),
+    "roseland": ("60628",),
+    "west pullman": ("60628", "60643"),
+    "morgan park": ("60643",),
+    "beverly": ("60643",),
+    "ashburn": ("60652",),
+    "archer heights": ("60632", "60638"),
+    "brighton park": ("60632", "60629"),
+    "mckinley park": ("60609", "60632"),
+    "back of the yards": ("60609", "60632"),
+    "new city": ("60609", "60632"),
+    "gage park": ("60629", "60632"),
+    "west lawn": ("60629",),
+    "garfield ridge": ("60638",),
+    "clearing": ("60638",),
+    "west elsd": ("60638",),
 }
 
-def get_zips_for_neighborhood(neighborhood: str) -> List[str]:
+# Interned so lookups and ZIP comparisons downstream hit the identity fast path
+NEIGHBORHOOD_TO_ZIPS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    sys.intern(name): tuple(sys.intern(z) for z in zips)
+    for name, zips in _RAW_NEIGHBORHOOD_TO_ZIPS.items()
+})
+
+# Sorted once; the mapping is read-only
+_ALL_NEIGHBORHOODS: Tuple[str, ...] = tuple(sorted(NEIGHBORHOOD_TO_ZIPS))
+
+# Reverse index for get_neighborhoods_for_zip
+_zip_index: Dict[str, List[str]] = {}
+for _name, _zips in NEIGHBORHOOD_TO_ZIPS.items():
+    for _zip in _zips:
+        _zip_index.setdefault(_zip, []).append(_name)
+_ZIP_TO_NEIGHBORHOODS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    zip_code: tuple(names) for zip_code, names in _zip_index.items()
+})
+del _zip_index
+
+# Build the neighborhood matcher once at import so each query is a single scan.
+# Only whole-word, non-overlapping matches count, leftmost-longest: the alternation
+# is longest-first, so "west pullman" wins over "pullman" and "south loop" over "loop".
+_NEIGHBORHOOD_PATTERN = re.compile(
+    r"\b(" + "|".join(map(re.escape, sorted(NEIGHBORHOOD_TO_ZIPS, key=len, reverse=True))) + r")\b"
+)
+
+# Punctuation becomes whitespace so "Back-of-the-Yards" and "Pilsen," still match
+_PUNCT_TO_SPACE = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
+def normalize_query(text: str) -> str:
+    """Casefold, turn punctuation into spaces and collapse runs of whitespace."""
+    return " ".join(text.casefold().translate(_PUNCT_TO_SPACE).split())
+
+# Tries for the fuzzy lookup in get_zips_for_neighborhood, built once at import.
+# _KEY_TRIE holds the neighborhood names; _SUBSTRING_TRIE holds every suffix of
+# every name, so walking it with a string answers "is this inside a name?".
+# Each node remembers the earliest name (in dict order) reaching it.
+_KEY_ORDER = {name: i for i, name in enumerate(NEIGHBORHOOD_TO_ZIPS)}
+_KEY_END = ""
+_KEY_TRIE = {}
+_SUBSTRING_TRIE = {}
+
+for _name in NEIGHBORHOOD_TO_ZIPS:
+    _node = _KEY_TRIE
+    for _ch in _name:
+        _node = _node.setdefault(_ch, {})
+    _node[_KEY_END] = _name
+    for _start in range(len(_name) + 1):
+        _node = _SUBSTRING_TRIE
+        _node.setdefault(_KEY_END, _name)
+        for _ch in _name[_start:]:
+            _node = _node.setdefault(_ch, {})
+            _node.setdefault(_KEY_END, _name)
+
+def _names_inside(text: str) -> List[str]:
+    """Return every neighborhood name that occurs as a substring of text."""
+    found = []
+    for start in range(len(text)):
+        node = _KEY_TRIE
+        for ch in text[start:]:
+            node = node.get(ch)
+            if node is None:
+                break
+            if _KEY_END in node:
+                found.append(node[_KEY_END])
+    return found
+
+def _name_containing(text: str):
+    """Return the first neighborhood name that contains text, or None."""
+    node = _SUBSTRING_TRIE
+    for ch in text:
+        node = node.get(ch)
+        if node is None:
+            return None
+    return node[_KEY_END]
+
+def get_zips_for_neighborhood(neighborhood: str) -> Tuple[str, ...]:
     """Get ZIP codes for a neighborhood name (case-insensitive)."""
-    neighborhood_lower = neighborhood.lower().strip()
+    neighborhood_lower = normalize_query(neighborhood)
     
     # Direct match
     if neighborhood_lower in NEIGHBORHOOD_TO_ZIPS:
         return NEIGHBORHOOD_TO_ZIPS[neighborhood_lower]
     
-    # Fuzzy match - check if neighborhood name contains any key
-    for key, zips in NEIGHBORHOOD_TO_ZIPS.items():
-        if key in neighborhood_lower or neighborhood_lower in key:
-            return zips
+    # Fuzzy match - neighborhood name contains a key, or a key contains it
+    candidates = _names_inside(neighborhood_lower)
+    containing = _name_containing(neighborhood_lower)
+    if containing is not None:
+        candidates.append(containing)
+    if candidates:
+        return NEIGHBORHOOD_TO_ZIPS[min(candidates, key=_KEY_ORDER.__getitem__)]
     
-    return []
+    # Typo-tolerant match, e.g. "rogrs park"
+    match = process.extractOne(neighborhood_lower, _KEY_ORDER.keys(), scorer=fuzz.WRatio, score_cutoff=80)
+    if match:
+        return NEIGHBORHOOD_TO_ZIPS[match[0]]
+    
+    return ()
 
 def expand_neighborhood_query(query: str) -> Tuple[str, List[str]]:
     """
     Expand query to include ZIP codes if neighborhood is mentioned.
-    Returns (cleaned_query, list_of_zips)
+    Returns (cleaned_query, list_of_zips), ZIPs in the order they were mentioned.
     """
-    query_lower = query.lower()
-    found_zips = []
+    query_lower = normalize_query(query)
+    found_zips: Dict[str, None] = {}
     cleaned_query = query
     
-    # Check each neighborhood
-    for neighborhood, zips in NEIGHBORHOOD_TO_ZIPS.items():
-        if neighborhood in query_lower:
-            found_zips.extend(zips)
-            # Remove neighborhood name from query (optional - can keep both)
-            # cleaned_query = cleaned_query.replace(neighborhood, "").strip()
-    
-    # Remove duplicates
-    found_zips = list(set(found_zips))
+    # Find every neighborhood mentioned in one pass over the query
+    for neighborhood in _NEIGHBORHOOD_PATTERN.findall(query_lower):
+        found_zips.update(dict.fromkeys(NEIGHBORHOOD_TO_ZIPS[neighborhood]))
     
-    return cleaned_query, found_zips
+    return cleaned_query, list(found_zips)
+
+def get_neighborhoods_for_zip(zip_code: str) -> Tuple[str, ...]:
+    """Get the neighborhood names that include a ZIP code."""
+    return _ZIP_TO_NEIGHBORHOODS.get(zip_code.strip(), ())
 
-def get_all_neighborhoods() -> List[str]:
-    """Get list of all available neighborhood names."""
-    return sorted(list(NEIGHBORHOOD_TO_ZIPS.keys()))
+def get_all_neighborhoods() -> Tuple[str, ...]:
+    """Get all available neighborhood names, sorted."""
+    return _ALL_NEIGHBORHOODS
 
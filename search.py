@@ -3,11 +3,15 @@
 Enhanced search module with fuzzy matching and "open now" detection.
 """
 
+import heapq
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, time
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, FrozenSet
+import numpy as np
 import streamlit as st
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 import pytz
 
 # ===========================
@@ -55,6 +59,54 @@ BASE_SYNONYMS = {
     "medicaid": ["medicaid", "medicare", "insurance", "coverage"],
 }
 
+# Conceptual matching - general query concepts and the terms that satisfy them
+GENERAL_CONCEPTS = {
+    "health": ["clinic", "center", "care", "medical", "health"],
+    "help": ["assistance", "support", "services", "help", "aid"],
+    "care": ["treatment", "care", "services", "support"],
+    "class": ["education", "training", "course", "class", "learning"],
+    "food": ["pantry", "meals", "food", "nutrition", "hunger"],
+    "housing": ["shelter", "housing", "home", "residence"],
+    "legal": ["law", "attorney", "counsel", "immigration", "legal"]
+}
+
+@dataclass(frozen=True, slots=True)
+class SearchContext:
+    """Query and filters normalized once per search and shared by every item."""
+    query: str
+    query_lower: str
+    query_words: Tuple[str, ...]
+    zip_filter: str = "All"
+    lang_filter: str = "All"
+    service_filter: str = "All"
+    day_filter: str = "All"
+
+# One bit per weekday, matching the keys parse_hours writes into item["hours"]
+DAY_BITS = {
+    "monday": 1 << 0,
+    "tuesday": 1 << 1,
+    "wednesday": 1 << 2,
+    "thursday": 1 << 3,
+    "friday": 1 << 4,
+    "saturday": 1 << 5,
+    "sunday": 1 << 6,
+}
+
+@dataclass(frozen=True)
+class ItemColumns:
+    """Struct-of-arrays view of a dataset, built once per load for vectorized filtering."""
+    zips: np.ndarray  # ZIP code per item ("" when missing)
+    service_masks: np.ndarray  # bit per service, see service_bits
+    lang_masks: np.ndarray  # bit per language, see lang_bits
+    day_masks: np.ndarray  # bit per weekday, see DAY_BITS
+    service_bits: Dict[str, int]
+    lang_bits: Dict[str, int]
+    names_lower: List[str]
+    services_text_lower: List[str]
+    blobs: List[str]  # search_blob per item
+    blob_words: List[FrozenSet[str]]
+    blob_bigrams: List[FrozenSet[str]]
+
 # ===========================
 # Time and Availability Functions
 # ===========================
@@ -115,50 +167,56 @@ def get_next_open_time(record: Dict[str, Any], timezone: str = "America/Chicago"
 # Search Functions
 # ===========================
 
+# Whole-word keywords recognized by extract_key_terms (and the matching search patterns)
+_SERVICE_KEYWORDS = (
+    "dental", "pediatric", "mental", "primary", "urgent", "esl", "ged", "legal", "shelter", "womens",
+    "hiv", "nutrition", "mobile", "specialty", "citizenship", "literacy", "youth", "computer",
+    "workforce", "financial", "resettlement", "employment", "benefits", "food", "crisis",
+)
+_DAY_KEYWORDS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday", "mon", "tue", "wed", "thu", "fri", "sat", "sun")
+_TIME_KEYWORDS = ("now", "today", "open", "available")
+_DAY_NAMES = {
+    "mon": "monday", "tue": "tuesday", "wed": "wednesday",
+    "thu": "thursday", "fri": "friday", "sat": "saturday", "sun": "sunday"
+}
+
+# Keyword -> (kind, normalized value). Every keyword is a single whole word, so a dict
+# lookup per query word finds the same first match as searching each pattern.
+_KEY_TERM_LOOKUP = {
+    **{word: ("service", word) for word in _SERVICE_KEYWORDS},
+    **{word: ("day", _DAY_NAMES.get(word, word)) for word in _DAY_KEYWORDS},
+    **{word: ("time", word) for word in _TIME_KEYWORDS},
+}
+_KEY_TERM_KINDS = ("zip", "service", "day", "time")
+_WORD_TOKEN_RE = re.compile(r'\w+')
+
 @st.cache_resource
 def get_search_patterns():
     """Get compiled regex patterns for search - enhanced with subcategories."""
     return {
         "zip": re.compile(r'\b(60\d{3})\b'),
-        "service": re.compile(r'\b(dental|pediatric|mental|primary|urgent|esl|ged|legal|shelter|womens|hiv|nutrition|mobile|specialty|citizenship|literacy|youth|computer|workforce|financial|resettlement|employment|benefits|food|crisis)\b', re.I),
-        "day": re.compile(r'\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday|mon|tue|wed|thu|fri|sat|sun)\b', re.I),
-        "time": re.compile(r'\b(now|today|open|available)\b', re.I),
+        "service": re.compile(r'\b(' + '|'.join(_SERVICE_KEYWORDS) + r')\b', re.I),
+        "day": re.compile(r'\b(' + '|'.join(_DAY_KEYWORDS) + r')\b', re.I),
+        "time": re.compile(r'\b(' + '|'.join(_TIME_KEYWORDS) + r')\b', re.I),
     }
 
+@lru_cache(maxsize=256)
+def _scan_key_terms(query: str) -> Tuple[Tuple[str, str], ...]:
+    """First ZIP, service, day and time word of the query, from one pass over its words."""
+    found = {}
+    for word in _WORD_TOKEN_RE.findall(query):
+        # ZIP: a whole word of "60" plus three digits
+        if len(word) == 5 and word.startswith("60") and word[2:].isdecimal():
+            found.setdefault("zip", word)
+            continue
+        hit = _KEY_TERM_LOOKUP.get(word.lower())
+        if hit:
+            found.setdefault(hit[0], hit[1])
+    return tuple((kind, found[kind]) for kind in _KEY_TERM_KINDS if kind in found)
+
 def extract_key_terms(query: str) -> Dict[str, str]:
     """Extract key terms from query using synonyms and patterns."""
-    query_lower = query.lower()
-    patterns = get_search_patterns()
-    
-    extracted = {}
-    
-    # Extract ZIP code
-    zip_match = patterns["zip"].search(query)
-    if zip_match:
-        extracted["zip"] = zip_match.group(1)
-    
-    # Extract service type
-    service_match = patterns["service"].search(query)
-    if service_match:
-        extracted["service"] = service_match.group(1).lower()
-    
-    # Extract day
-    day_match = patterns["day"].search(query)
-    if day_match:
-        day = day_match.group(1).lower()
-        # Normalize day names
-        day_map = {
-            "mon": "monday", "tue": "tuesday", "wed": "wednesday",
-            "thu": "thursday", "fri": "friday", "sat": "saturday", "sun": "sunday"
-        }
-        extracted["day"] = day_map.get(day, day)
-    
-    # Extract time preference
-    time_match = patterns["time"].search(query)
-    if time_match:
-        extracted["time"] = time_match.group(1).lower()
-    
-    return extracted
+    return dict(_scan_key_terms(query))
 
 def expand_query_terms(query: str) -> List[str]:
     """Expand query with synonyms for better matching."""
@@ -174,6 +232,10 @@ def expand_query_terms(query: str) -> List[str]:
     
     return expanded_terms
 
+def _bigrams(text: str) -> FrozenSet[str]:
+    """Character bigrams of a string."""
+    return frozenset(text[i:i+2] for i in range(len(text)-1))
+
 def fuzzy_score(record: Dict[str, Any], query: str) -> float:
     """Calculate fuzzy match score for a record - more flexible matching."""
     search_blob = record.get("search_blob", "")
@@ -181,7 +243,14 @@ def fuzzy_score(record: Dict[str, Any], query: str) -> float:
         return 0.0
     
     query_lower = query.lower()
-    
+    return _fuzzy_score_parts(
+        search_blob, set(search_blob.split()), _bigrams(search_blob),
+        query_lower, set(query_lower.split()), _bigrams(query_lower)
+    )
+
+def _fuzzy_score_parts(search_blob: str, words_blob: set, blob_bigrams: FrozenSet[str],
+                       query_lower: str, words_query: set, query_bigrams: FrozenSet[str]) -> float:
+    """fuzzy_score with the blob/query word and bigram sets computed by the caller."""
     # Multiple fuzzy matching strategies for flexibility
     # 1. Token sort ratio (handles word order differences)
     token_sort = fuzz.token_sort_ratio(search_blob, query_lower) / 100.0
@@ -193,16 +262,10 @@ def fuzzy_score(record: Dict[str, Any], query: str) -> float:
     partial = fuzz.partial_ratio(search_blob, query_lower) / 100.0
     
     # 4. Word-based partial matching (catches "dent" matching "dental")
-    words_query = set(query_lower.split())
-    words_blob = set(search_blob.split())
     word_overlap = len(words_query & words_blob) / max(len(words_query), 1)
     
     # 5. Character n-gram overlap (catches misspellings, variations)
     # Simple bigram similarity
-    def get_bigrams(text):
-        return set(text[i:i+2] for i in range(len(text)-1))
-    query_bigrams = get_bigrams(query_lower)
-    blob_bigrams = get_bigrams(search_blob)
     bigram_overlap = len(query_bigrams & blob_bigrams) / max(len(query_bigrams), 1) if query_bigrams else 0
     
     # Combine scores (weighted average favoring stronger matches)
@@ -216,6 +279,51 @@ def fuzzy_score(record: Dict[str, Any], query: str) -> float:
     
     return min(combined_score, 1.0)  # Cap at 1.0
 
+def _max_fuzzy_scores(
+    columns: "ItemColumns",
+    indices: np.ndarray,
+    expanded_queries: List[Tuple[str, set, FrozenSet[str]]]
+) -> np.ndarray:
+    """Best _fuzzy_score_parts over the expanded queries for each indexed item.
+    
+    The three RapidFuzz ratios are computed for all items at once with process.cdist,
+    which runs in native code across all cores; the set overlaps stay in Python.
+    """
+    best = np.zeros(len(indices))
+    if not len(indices) or not expanded_queries:
+        return best
+    
+    blobs = [columns.blobs[i] for i in indices]
+    queries = [expanded for expanded, _, _ in expanded_queries]
+    ratios = [
+        process.cdist(queries, blobs, scorer=scorer, dtype=np.float64, workers=-1) / 100.0
+        for scorer in (fuzz.token_sort_ratio, fuzz.token_set_ratio, fuzz.partial_ratio)
+    ]
+    
+    for q, (_, words_query, query_bigrams) in enumerate(expanded_queries):
+        word_overlap = np.array([
+            len(words_query & columns.blob_words[i]) for i in indices
+        ]) / max(len(words_query), 1)
+        if query_bigrams:
+            bigram_overlap = np.array([
+                len(query_bigrams & columns.blob_bigrams[i]) for i in indices
+            ]) / max(len(query_bigrams), 1)
+        else:
+            bigram_overlap = np.zeros(len(indices))
+        
+        combined = (
+            ratios[0][q] * 0.3 +
+            ratios[1][q] * 0.25 +
+            ratios[2][q] * 0.2 +
+            word_overlap * 0.15 +
+            bigram_overlap * 0.1
+        )
+        np.maximum(best, np.minimum(combined, 1.0), out=best)
+    
+    # Items without a search blob get no fuzzy credit
+    best[[not blob for blob in blobs]] = 0.0
+    return best
+
 def must_have_patterns(query: str, category: str) -> List[re.Pattern]:
     """Get must-have patterns based on query and category - FLEXIBLE matching (not strict)."""
     patterns = []
@@ -271,6 +379,95 @@ def must_have_patterns(query: str, category: str) -> List[re.Pattern]:
     
     return patterns
 
+def _bitmask_column(values_per_item: List[List[str]]) -> Tuple[Dict[str, int], np.ndarray]:
+    """Assign one bit per distinct value and OR each item's values into a mask."""
+    bits = {}
+    for values in values_per_item:
+        for value in values:
+            bits.setdefault(value, 1 << len(bits))
+    # Fall back to Python ints if the vocabulary outgrows 64 bits
+    dtype = np.uint64 if len(bits) <= 64 else object
+    masks = np.zeros(len(values_per_item), dtype=dtype)
+    for i, values in enumerate(values_per_item):
+        mask = 0
+        for value in values:
+            mask |= bits[value]
+        masks[i] = mask
+    return bits, masks
+
+def build_item_columns(items: List[Dict[str, Any]]) -> ItemColumns:
+    """Convert the list of item dicts into the columns used by rank_items_ctx."""
+    service_bits, service_masks = _bitmask_column([item.get("services") or [] for item in items])
+    lang_bits, lang_masks = _bitmask_column([item.get("languages") or [] for item in items])
+    
+    day_masks = np.zeros(len(items), dtype=np.uint8)
+    for i, item in enumerate(items):
+        hours = item.get("hours")
+        if isinstance(hours, dict):
+            for day in hours:
+                day_masks[i] |= DAY_BITS.get(day, 0)
+    
+    blobs = [item.get("search_blob", "") for item in items]
+    
+    return ItemColumns(
+        zips=np.array([item.get("zip_code") or "" for item in items], dtype=object),
+        service_masks=service_masks,
+        lang_masks=lang_masks,
+        day_masks=day_masks,
+        service_bits=service_bits,
+        lang_bits=lang_bits,
+        names_lower=[item.get("name", "").lower() for item in items],
+        services_text_lower=[item.get("services_text", "").lower() for item in items],
+        blobs=blobs,
+        blob_words=[frozenset(blob.split()) for blob in blobs],
+        blob_bigrams=[_bigrams(blob) for blob in blobs],
+    )
+
+def _has_bit(masks: np.ndarray, bit: Optional[int]) -> np.ndarray:
+    """Boolean column: which masks have the given bit set (none if bit is unknown)."""
+    if bit is None:
+        return np.zeros(len(masks), dtype=bool)
+    return (masks & masks.dtype.type(bit)) != 0
+
+def filter_indices(columns: ItemColumns, ctx: SearchContext) -> np.ndarray:
+    """Indices of the items that pass the context's ZIP/language/service/day filters."""
+    keep = np.ones(len(columns.zips), dtype=bool)
+    if ctx.zip_filter != "All":
+        keep &= columns.zips == ctx.zip_filter
+    if ctx.lang_filter != "All":
+        keep &= _has_bit(columns.lang_masks, columns.lang_bits.get(ctx.lang_filter))
+    if ctx.service_filter != "All":
+        keep &= _has_bit(columns.service_masks, columns.service_bits.get(ctx.service_filter))
+    if ctx.day_filter != "All":
+        keep &= _has_bit(columns.day_masks, DAY_BITS.get(ctx.day_filter))
+    return np.flatnonzero(keep)
+
+def normalize_filter(value: Optional[str], lowercase: bool = True) -> str:
+    """Normalize a filter value; empty values and "All" mean no filter."""
+    if not value or value == "All":
+        return "All"
+    value = value.strip()
+    return value.lower() if lowercase else value
+
+def build_search_context(
+    query: str,
+    zip_filter: str = "All",
+    lang_filter: str = "All",
+    service_filter: str = "All",
+    day_filter: str = "All"
+) -> SearchContext:
+    """Normalize the query and filters once before ranking."""
+    query_lower = query.lower()
+    return SearchContext(
+        query=query,
+        query_lower=query_lower,
+        query_words=tuple(query_lower.split()),
+        zip_filter=normalize_filter(zip_filter, lowercase=False),
+        lang_filter=normalize_filter(lang_filter),
+        service_filter=normalize_filter(service_filter),
+        day_filter=normalize_filter(day_filter),
+    )
+
 def rank_items(
     items: List[Dict[str, Any]], 
     query: str, 
@@ -278,9 +475,28 @@ def rank_items(
     zip_filter: str = "All",
     lang_filter: str = "All", 
     service_filter: str = "All",
-    day_filter: str = "All"
+    day_filter: str = "All",
+    limit: Optional[int] = None
 ) -> List[Tuple[float, Dict[str, Any]]]:
     """Enhanced ranking with fuzzy matching and filters."""
+    ctx = build_search_context(query, zip_filter, lang_filter, service_filter, day_filter)
+    return rank_items_ctx(items, ctx, category, limit=limit)
+
+def rank_items_ctx(
+    items: List[Dict[str, Any]],
+    ctx: SearchContext,
+    category: str,
+    columns: Optional[ItemColumns] = None,
+    limit: Optional[int] = None
+) -> List[Tuple[float, Dict[str, Any]]]:
+    """Rank items against a prebuilt SearchContext.
+    
+    Pass the dataset's ItemColumns (see build_item_columns) to avoid rebuilding them per search.
+    With limit, only the best `limit` results are selected (heapq) instead of sorting them all.
+    """
+    query = ctx.query
+    query_lower = ctx.query_lower
+    query_words = ctx.query_words
     
     if not items or not query.strip():
         return []
@@ -291,33 +507,51 @@ def rank_items(
     # Get must-have patterns
     must_have = must_have_patterns(query, category)
     
-    # Expand query terms
-    expanded_queries = expand_query_terms(query)
+    # Expand query terms, with the query side of the fuzzy score computed once
+    expanded_queries = [
+        (expanded, set(expanded.split()), _bigrams(expanded))
+        for expanded in expand_query_terms(query)
+    ]
+    
+    # Synonyms mentioned in the query, grouped like BASE_SYNONYMS
+    query_synonym_groups = [
+        [synonym for synonym in synonym_list if synonym in query_lower]
+        for synonym_list in BASE_SYNONYMS.values()
+    ]
+    query_synonym_groups = [group for group in query_synonym_groups if group]
+    
+    # Concepts mentioned in the query
+    query_concepts = [related for concept, related in GENERAL_CONCEPTS.items() if concept in query_lower]
+    
+    # Query words long enough for partial matching
+    partial_query_words = [q_word for q_word in query_words if len(q_word) >= 3]
+    
+    wants_open_now = key_terms.get("time") in ["now", "today", "open"]
+    
+    # Timing queries sort open items first, so open status is needed for every item
+    timing_keywords = ["now", "today", "open", "available", "immediate", "urgent"]
+    wants_timing = any(kw in query_lower for kw in timing_keywords) or key_terms.get("time")
+    
+    # Apply filters over the whole dataset at once
+    if columns is None:
+        columns = build_item_columns(items)
+    
+    indices = filter_indices(columns, ctx)
+    
+    # Per-item scores that only need column lookups are computed for all items at once
+    fuzzy_scores = _max_fuzzy_scores(columns, indices, expanded_queries).tolist()
+    zip_bonus = day_bonus = [0.0] * len(indices)
+    if key_terms.get("zip"):
+        zip_bonus = np.where(columns.zips[indices] == key_terms["zip"], 0.3, 0.0).tolist()
+    if key_terms.get("day"):
+        day_bonus = np.where(_has_bit(columns.day_masks[indices], DAY_BITS.get(key_terms["day"])), 0.2, 0.0).tolist()
     
     scored_items = []
     
-    for item in items:
+    for k, i in enumerate(indices.tolist()):
+        item = items[i]
         score = 0.0
         
-        # Apply filters
-        if zip_filter != "All" and item.get("zip_code") != zip_filter:
-            continue
-        
-        if lang_filter != "All":
-            languages = item.get("languages", [])
-            if lang_filter not in languages:
-                continue
-        
-        if service_filter != "All":
-            services = item.get("services", [])
-            if service_filter not in services:
-                continue
-        
-        if day_filter != "All":
-            hours = item.get("hours", {})
-            if day_filter not in hours:
-                continue
-        
         # Check must-have patterns - MAKE IT SOFT/WARNING, NOT HARD FILTER
         # Only skip if query is very specific and pattern definitely doesn't match
         search_text = item.get("search_blob", "")
@@ -331,27 +565,20 @@ def rank_items(
                 pass  # Let fuzzy matching handle it instead
         
         # Base fuzzy score
-        max_fuzzy_score = 0.0
-        for expanded_query in expanded_queries:
-            fuzzy_score_val = fuzzy_score(item, expanded_query)
-            max_fuzzy_score = max(max_fuzzy_score, fuzzy_score_val)
-        
-        score += max_fuzzy_score * 0.7  # 70% weight for fuzzy matching (increased from 60%)
+        score += fuzzy_scores[k] * 0.7  # 70% weight for fuzzy matching (increased from 60%)
         
         # Bonus for exact matches
-        query_lower = query.lower()
         if query_lower in search_text:
             score += 0.3
         
         # Bonus for name matches
-        name = item.get("name", "").lower()
-        if query_lower in name:
+        if query_lower in columns.names_lower[i]:
             score += 0.2
         
         # Bonus for service matches (both normalized services and subcategories)
         services = item.get("services", [])
         subcategories = item.get("subcategories", [])
-        services_text = item.get("services_text", "").lower()
+        services_text = columns.services_text_lower[i]
         
         # Check normalized services
         for service in services:
@@ -365,78 +592,56 @@ def rank_items(
         
         # Bonus for matches in full services text (semantic matching)
         if services_text:
-            for synonym_list in BASE_SYNONYMS.values():
-                for synonym in synonym_list:
-                    if synonym in query_lower and synonym in services_text:
-                        score += 0.1
-                        break
+            for group in query_synonym_groups:
+                if any(synonym in services_text for synonym in group):
+                    score += 0.1
         
         # Partial word matching - catch "dent" matching "dental", "psych" matching "psychology"
-        # Split query into words and check if any word is a prefix/substring of service words
-        query_words = query_lower.split()
+        # Check if any query word is a prefix/substring of service words
         service_words = services_text.split()
-        for q_word in query_words:
-            if len(q_word) >= 3:  # Only check words 3+ chars (avoid "a", "an", "the")
-                # Check if query word is contained in any service word (or vice versa)
-                for s_word in service_words:
-                    if q_word in s_word or s_word in q_word:
-                        score += 0.05  # Small bonus for partial matches
-                        break
+        for q_word in partial_query_words:
+            # Check if query word is contained in any service word (or vice versa)
+            for s_word in service_words:
+                if q_word in s_word or s_word in q_word:
+                    score += 0.05  # Small bonus for partial matches
+                    break
         
         # Conceptual matching - if query mentions general concepts, boost scores
         # e.g., "health services" should match clinics, centers, etc.
-        general_concepts = {
-            "health": ["clinic", "center", "care", "medical", "health"],
-            "help": ["assistance", "support", "services", "help", "aid"],
-            "care": ["treatment", "care", "services", "support"],
-            "class": ["education", "training", "course", "class", "learning"],
-            "food": ["pantry", "meals", "food", "nutrition", "hunger"],
-            "housing": ["shelter", "housing", "home", "residence"],
-            "legal": ["law", "attorney", "counsel", "immigration", "legal"]
-        }
-        for concept, related_terms in general_concepts.items():
-            if concept in query_lower:
-                if any(term in search_text for term in related_terms):
-                    score += 0.08  # Bonus for conceptual match
+        for related_terms in query_concepts:
+            if any(term in search_text for term in related_terms):
+                score += 0.08  # Bonus for conceptual match
         
         # Bonus for "open now"
-        if key_terms.get("time") in ["now", "today", "open"]:
-            if is_open_now(item):
+        is_open = is_open_now(item) if wants_open_now or wants_timing else False
+        if wants_open_now:
+            if is_open:
                 score += 0.4
         
         # Bonus for ZIP match
-        if key_terms.get("zip"):
-            if item.get("zip_code") == key_terms["zip"]:
-                score += 0.3
+        score += zip_bonus[k]
         
         # Bonus for day match
-        if key_terms.get("day"):
-            hours = item.get("hours", {})
-            if key_terms["day"] in hours:
-                score += 0.2
+        score += day_bonus[k]
         
-        scored_items.append((score, item))
+        scored_items.append((score, is_open, item))
     
-    # Sort by score (highest first), but prioritize "open now" when user queries timing
-    query_lower = query.lower()
-    timing_keywords = ["now", "today", "open", "available", "immediate", "urgent"]
-    wants_timing = any(kw in query_lower for kw in timing_keywords) or key_terms.get("time")
+    # Filter out very low scores - MORE LENIENT (lower threshold for flexibility)
+    # Changed from 0.1 to 0.05 to allow more results through
+    scored_items = [entry for entry in scored_items if entry[0] > 0.05]
     
-    # If user wants timing, sort by: open_now status first, then score
+    # Sort by score (highest first); if user wants timing, by open_now status first, then score
     if wants_timing:
-        def sort_key(x):
-            score, item = x
-            is_open = is_open_now(item)
-            # Open items get +1000 to sort first, then by score
-            return (is_open, score)
-        scored_items.sort(key=sort_key, reverse=True)
+        sort_key = lambda x: (x[1], x[0])
     else:
-        # Normal sort by score
-        scored_items.sort(key=lambda x: x[0], reverse=True)
+        sort_key = lambda x: x[0]
+    if limit is not None:
+        # Same order as the full sort, but only the top `limit` are kept
+        scored_items = heapq.nlargest(limit, scored_items, key=sort_key)
+    else:
+        scored_items.sort(key=sort_key, reverse=True)
     
-    # Filter out very low scores - MORE LENIENT (lower threshold for flexibility)
-    # Changed from 0.1 to 0.05 to allow more results through
-    return [(score, item) for score, item in scored_items if score > 0.05]
+    return [(score, item) for score, _, item in scored_items]
 
 # ===========================
 # Utility Functions
@@ -474,3 +679,14 @@ def clean_query_of_service_and_day(query: str, detected_service: str = None, det
         cleaned = re.sub(rf'\b{re.escape(detected_day)}\b', '', cleaned, flags=re.I)
     
     return cleaned.strip()
+
+@lru_cache(maxsize=128)
+def _detected_terms_pattern(phrases: Tuple[str, ...]) -> re.Pattern:
+    """ZIP codes plus each detected phrase, as one whole-word alternation."""
+    alternatives = [r'60\d{3}'] + [re.escape(phrase) for phrase in phrases]
+    return re.compile(r'\b(?:' + '|'.join(alternatives) + r')\b', re.I)
+
+def clean_query_of_detected(query: str, detected_service: str = None, detected_day: str = None) -> str:
+    """Remove ZIP codes and detected service/day terms from query in a single pass."""
+    phrases = tuple(phrase for phrase in (detected_service, detected_day) if phrase)
+    return _detected_terms_pattern(phrases).sub("", query).strip()
@@ -7,6 +7,12 @@ import streamlit as st
 from typing import List, Dict, Any, Tuple
 import re
 
+# Patterns used per item by the quick filters, compiled once
+_DIGIT_RE = re.compile(r'\d')
+_FREE_RE = re.compile(r'\b(free|no cost|no-cost|complimentary)\b')
+_MEDICAID_RE = re.compile(r'\b(medicaid|medicare|insurance)\b')
+_WALKIN_RE = re.compile(r'\b(walk.?in|walk in|no appointment)\b')
+
 def get_search_suggestions(query: str, category: str, items: List[Dict]) -> List[str]:
     """Generate search suggestions based on query and available resources."""
     if not query or len(query) < 2:
@@ -45,12 +51,12 @@ def get_search_suggestions(query: str, category: str, items: List[Dict]) -> List
         suggestions.extend(["legal help", "immigration assistance", "housing"])
     
     # Add ZIP suggestions if query has numbers
-    if re.search(r'\d', query):
+    if _DIGIT_RE.search(query):
         suggestions.append("60629")
         suggestions.append("60640")
         suggestions.append("60625")
     
-    return list(set(suggestions[:5]))  # Return top 5 unique suggestions
+    return suggestions[:5]  # Return top 5 (the suggestions above never repeat)
 
 def get_quick_filters(category: str, items: List[Dict]) -> Dict[str, int]:
     """Get counts for quick filter buttons."""
@@ -73,7 +79,7 @@ def get_quick_filters(category: str, items: List[Dict]) -> Dict[str, int]:
     for item in items:
         # Check for free services
         services_text = (item.get("services", "") + " " + item.get("name", "")).lower()
-        if re.search(r'\b(free|no cost|no-cost|complimentary)\b', services_text):
+        if _FREE_RE.search(services_text):
             counts["Free"] += 1
         
         # Check for open now (try search module first, fallback to basic check)
@@ -93,11 +99,11 @@ def get_quick_filters(category: str, items: List[Dict]) -> Dict[str, int]:
             pass
         
         # Check for Medicaid
-        if re.search(r'\b(medicaid|medicare|insurance)\b', services_text):
+        if _MEDICAID_RE.search(services_text):
             counts["Accepts Medicaid"] += 1
         
         # Check for walk-in
-        if re.search(r'\b(walk.?in|walk in|no appointment)\b', services_text):
+        if _WALKIN_RE.search(services_text):
             counts["Walk-in"] += 1
     
     return counts
@@ -163,7 +169,7 @@ def filter_by_quick_filters(items: List[Dict], filters: Dict[str, bool]) -> List
         match = True
         
         if filters.get("free"):
-            if not re.search(r'\b(free|no cost|no-cost|complimentary)\b', services_text):
+            if not _FREE_RE.search(services_text):
                 match = False
         
         if filters.get("open_now"):
@@ -185,11 +191,11 @@ def filter_by_quick_filters(items: List[Dict], filters: Dict[str, bool]) -> List
                 match = False
         
         if filters.get("medicaid"):
-            if not re.search(r'\b(medicaid|medicare|insurance)\b', services_text):
+            if not _MEDICAID_RE.search(services_text):
                 match = False
         
         if filters.get("walkin"):
-            if not re.search(r'\b(walk.?in|walk in|no appointment)\b', services_text):
+            if not _WALKIN_RE.search(services_text):
                 match = False
         
         if match:
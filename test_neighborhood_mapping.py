@@ -0,0 +1,31 @@
+"""Tests for the neighborhood matching in neighborhood_mapping."""
+import pytest
+
+import neighborhood_mapping as nm
+
+def zips(*names):
+    return [zip_code for name in names for zip_code in nm.NEIGHBORHOOD_TO_ZIPS[name]]
+
+def test_nested_neighborhood_is_matched_once():
+    assert nm.expand_neighborhood_query("clinics in the South Loop")[1] == zips("south loop")
+
+def test_longest_name_wins():
+    assert nm.expand_neighborhood_query("west pullman")[1] == zips("west pullman")
+
+def test_separate_mentions_are_all_found():
+    assert nm.expand_neighborhood_query("pullman and west pullman")[1] == list(dict.fromkeys(zips("pullman", "west pullman")))
+
+def test_partial_word_does_not_match():
+    assert nm.expand_neighborhood_query("south loopy")[1] == []
+
+def test_punctuation_is_ignored():
+    assert nm.expand_neighborhood_query("Back-of-the-Yards food pantry")[1] == zips("back of the yards")
+    assert nm.expand_neighborhood_query("Pilsen, please")[1] == zips("pilsen")
+
+def test_no_neighborhood():
+    query = "dental clinic open monday"
+    assert nm.expand_neighborhood_query(query) == (query, [])
+
+@pytest.mark.parametrize("name", nm.get_all_neighborhoods())
+def test_every_name_matches_itself(name):
+    assert nm.expand_neighborhood_query(name.title())[1] == list(nm.NEIGHBORHOOD_TO_ZIPS[name])
@@ -7,6 +7,7 @@ import streamlit as st
 import urllib.parse
 from typing import Dict, Any, List
 import search
+import data_loader
 
 # ===========================
 # Card Components
@@ -252,20 +253,16 @@ def export_pins_json(pinned: List[Dict[str, Any]]) -> None:
 # Enhanced Filters
 # ===========================
 
-def render_enhanced_filters(category: str, items: List[Dict[str, Any]]) -> tuple:
-    """Render enhanced filter controls."""
+def render_enhanced_filters(category: str, items: List[Dict[str, Any]], meta: Dict[str, Any] = None) -> tuple:
+    """Render enhanced filter controls. `meta` is data_loader.category_meta() for `items`."""
     
-    # Extract unique values from items
-    all_zips = sorted(set(item.get("zip_code", "") for item in items if item.get("zip_code")))
-    all_langs = sorted(set(lang for item in items for lang in item.get("languages", [])))
-    all_services = sorted(set(service for item in items for service in item.get("services", [])))
-    
-    # Get available days from hours data
-    all_days = set()
-    for item in items:
-        hours = item.get("hours", {})
-        all_days.update(hours.keys())
-    all_days = sorted(all_days)
+    # Unique values from the precomputed meta, or from one pass over the items
+    if meta is None:
+        meta = data_loader.category_meta(items)
+    all_zips = sorted(meta["zips"])
+    all_langs = sorted(meta["langs"])
+    all_services = sorted(meta["services"])
+    all_days = sorted(meta["days"])
     
     # Filter options
     zip_options = ["All"] + all_zips
@@ -378,7 +375,7 @@ def render_pagination_controls(total_results: int, shown_count: int) -> bool:
     remaining = total_results - shown_count
     st.info(f"Showing {shown_count} of {total_results} results. {remaining} more available.")
     
-    if st.button("📄 Show More Results", key="show_more"):
+    if st.button("📄 Show More Results", key="show_more_button"):
         return True
     
     return False